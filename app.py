@@ -1,11 +1,17 @@
+# requests, geopy and bs4 are imported inside the functions that use them so
+# that cold starts only pay for them once a request actually needs them.
+# benchmarks/import_time.py enforces this and the overall import budget.
 from flask import Flask, send_file
-import requests
-import folium
-from geopy.geocoders import Nominatim
-from geopy.extra.rate_limiter import RateLimiter
-from bs4 import BeautifulSoup
 import os
+import re
+import struct
+import sys
 import logging
+import threading
+import time
+import zlib
+from array import array
+from collections import deque
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -17,7 +23,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('app.log'),
+        logging.FileHandler('app.log', delay=True),  # opened on the first log record
         logging.StreamHandler()
     ]
 )
@@ -28,14 +34,49 @@ app = Flask(__name__)
 # Configuration
 CONFIG = {
     'NEWS_API_KEY': os.getenv('NEWS_API_KEY', '38db7510a9b94a369613c47864991de9'),
+    'NEWS_API_URL': os.getenv('NEWS_API_URL', 'https://newsapi.org/v2/everything'),
     'REQUEST_TIMEOUT': 10,
+    # Article page fetches: negative cache for failed URLs and per-domain backoff
+    'FETCH_NEGATIVE_CACHE_MINUTES': int(os.getenv('FETCH_NEGATIVE_CACHE_MINUTES', 360)),
+    'FETCH_DOMAIN_FAILURE_THRESHOLD': int(os.getenv('FETCH_DOMAIN_FAILURE_THRESHOLD', 3)),
+    'FETCH_DOMAIN_COOLDOWN': float(os.getenv('FETCH_DOMAIN_COOLDOWN', 300)),  # seconds, doubles per re-trip
+    'FETCH_DOMAIN_MAX_COOLDOWN': float(os.getenv('FETCH_DOMAIN_MAX_COOLDOWN', 6 * 3600)),
     'MAX_ARTICLES': 100,  # Increased for timeline
     'CACHE_DURATION_MINUTES': 30,
-    'RATE_LIMIT_DELAY': 2,
+    # Geocoder backend: public Nominatim by default, or a self-hosted Nominatim/Photon URL
+    'GEOCODER_BACKEND': os.getenv('GEOCODER_BACKEND', 'nominatim'),  # nominatim or photon
+    'GEOCODER_URL': os.getenv('GEOCODER_URL', ''),  # e.g. http://localhost:8088
+    'GEOCODER_TIMEOUT': float(os.getenv('GEOCODER_TIMEOUT', 5)),
+    'GEOCODER_MAX_RETRIES': int(os.getenv('GEOCODER_MAX_RETRIES', 3)),
+    'GEOCODER_BREAKER_THRESHOLD': int(os.getenv('GEOCODER_BREAKER_THRESHOLD', 5)),  # consecutive failures
+    'GEOCODER_BREAKER_COOLDOWN': float(os.getenv('GEOCODER_BREAKER_COOLDOWN', 60)),  # seconds
+    # Public Nominatim allows one request per second; self-hosted instances default to no delay
+    'RATE_LIMIT_DELAY': float(os.getenv('RATE_LIMIT_DELAY', 0 if os.getenv('GEOCODER_URL') else 2)),
+    'EXTRACTION_WORKERS': int(os.getenv('EXTRACTION_WORKERS', 0)),  # 0 = one per CPU
+    'PARALLEL_EXTRACTION_MIN_BATCH': int(os.getenv('PARALLEL_EXTRACTION_MIN_BATCH', 500)),
+    # Parallel geocoder requests; only raise for self-hosted Nominatim with RATE_LIMIT_DELAY lowered
+    'GEOCODE_CONCURRENCY': int(os.getenv('GEOCODE_CONCURRENCY', 1)),
+    # Rebuild in the background every N minutes and push changes to /api/stream (0 = only on page requests)
+    'INGEST_INTERVAL_MINUTES': float(os.getenv('INGEST_INTERVAL_MINUTES', 0)),
+    'SSE_KEEPALIVE_SECONDS': 15,
+    'SSE_HISTORY_SIZE': 1000,  # recent events kept for reconnecting clients
+    # Processed articles are persisted here after each build and served at boot ('' disables)
+    'SNAPSHOT_PATH': os.getenv('SNAPSHOT_PATH', 'articles.snapshot'),
     'TRUMP_INAUGURATION': '2025-01-20',  # Timeline start date
     'ARTICLES_PER_PAGE': 100
 }
 
+# More targeted search queries for immigration enforcement
+NEWS_QUERIES = [
+    "ICE raids OR ICE arrests",
+    "immigration enforcement", 
+    "border patrol arrests",
+    "ICE detention OR ICE operation",
+    "deportation raids",
+    "HSI arrests OR homeland security",
+    "CBP arrests OR customs border"
+]
+
 # Simple in-memory cache
 # Clear all cache to force fresh real data
 cache = {}
@@ -121,8 +162,373 @@ location_map = {
     "arizona": "Phoenix, AZ"
 }
 
+class Article:
+    """Compact article record used throughout the scrape/extract/render pipeline.
+
+    Repeated string fields are interned. Records returned by ``scrape_news``
+    are served as-is by the API, so they keep ``content`` until their cache
+    entry expires (CACHE_DURATION_MINUTES) rather than being released after
+    extraction. Builds never modify them; the map, stream and snapshot hold
+    content-free ``located()`` copies, which share the records' strings.
+    """
+
+    __slots__ = (
+        'title', 'url', 'location', 'published_at', 'date', 'description', 'source',
+        'content', 'location_name', 'coords', 'id'
+    )
+
+    def __init__(self, title: str, url: str, published_at: str, date: str,
+                 description: str = "", source: str = "Unknown", content: str = ""):
+        self.title = title
+        self.url = url
+        self.location = None  # Will be extracted later
+        self.published_at = published_at
+        self.date = sys.intern(date)
+        self.description = description
+        self.source = sys.intern(source or "Unknown")
+        self.content = content
+        self.location_name = None
+        self.coords = None
+        self.id = None
+
+    def set_location(self, location_name: str, coords: list, marker_id: str) -> None:
+        """Attach extraction and geocoding results to the record."""
+        self.location_name = sys.intern(location_name)
+        self.coords = coords
+        self.id = marker_id
+
+    def located(self, location_name: str, coords: list, marker_id: str) -> "Article":
+        """Return a copy without the article body that carries the map location."""
+        copy = Article(self.title, self.url, self.published_at, self.date, self.description, self.source, None)
+        copy.location = self.location
+        copy.set_location(location_name, coords, marker_id)
+        return copy
+
+    def to_dict(self) -> dict:
+        """Return the JSON-serializable form used by the API and the map page."""
+        data = {
+            "title": self.title,
+            "url": self.url,
+            "location": self.location,
+            "published_at": self.published_at,
+            "date": self.date,
+            "description": self.description,
+            "source": self.source,
+            "content": self.content
+        }
+        if self.location_name is not None:
+            data["location_name"] = self.location_name
+            data["coords"] = self.coords
+            data["id"] = self.id
+        return data
+
+
+class TimelineStats:
+    """Incrementally maintained (date, location_key, source) -> count aggregate index.
+
+    Keys are interned into small lookup tables and the rows are stored as
+    parallel array-backed columns, so range queries never touch article bodies.
+    """
+
+    GROUP_COLUMNS = ('date', 'location', 'source')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {column: [] for column in self.GROUP_COLUMNS}
+        self._ids = {column: {} for column in self.GROUP_COLUMNS}
+        self._date_ids = array('I')
+        self._location_ids = array('I')
+        self._source_ids = array('I')
+        self._counts = array('I')
+        self._rows = {}       # (date_id, location_id, source_id) -> row
+        self._url_rows = {}   # article url -> row it was counted in
+
+    def _intern(self, column: str, value: str) -> int:
+        ids = self._ids[column]
+        if value not in ids:
+            ids[value] = len(self._values[column])
+            self._values[column].append(value)
+        return ids[value]
+
+    def record(self, url: str, date: str, location_key: str, source: str) -> None:
+        """Count an article once; re-recording a URL moves it to its new key."""
+        with self._lock:
+            key = (
+                self._intern('date', date),
+                self._intern('location', location_key),
+                self._intern('source', source or 'Unknown'),
+            )
+            row = self._rows.get(key)
+            previous = self._url_rows.get(url)
+            if previous is not None and previous == row:
+                return
+            if previous is not None:
+                self._counts[previous] -= 1
+            if row is None:
+                row = len(self._counts)
+                self._rows[key] = row
+                self._date_ids.append(key[0])
+                self._location_ids.append(key[1])
+                self._source_ids.append(key[2])
+                self._counts.append(0)
+            self._counts[row] += 1
+            self._url_rows[url] = row
+
+    def query(self, group_by: str = 'date', from_date: str = None, to_date: str = None,
+              location: str = None, source: str = None) -> dict:
+        """Return counts grouped by one column, filtered by date range, location and source."""
+        if group_by not in self.GROUP_COLUMNS:
+            raise ValueError(f"group_by must be one of {', '.join(self.GROUP_COLUMNS)}")
+        with self._lock:
+            dates = self._values['date']
+            wanted_dates = {
+                date_id for date_id, date in enumerate(dates)
+                if (not from_date or date >= from_date) and (not to_date or date <= to_date)
+            }
+            location_id = self._ids['location'].get(location) if location else None
+            source_id = self._ids['source'].get(source) if source else None
+            if (location and location_id is None) or (source and source_id is None):
+                return {}
+
+            columns = {
+                'date': self._date_ids,
+                'location': self._location_ids,
+                'source': self._source_ids,
+            }
+            group_ids = columns[group_by]
+            group_values = self._values[group_by]
+            totals = {}
+            for row, count in enumerate(self._counts):
+                if not count or self._date_ids[row] not in wanted_dates:
+                    continue
+                if location_id is not None and self._location_ids[row] != location_id:
+                    continue
+                if source_id is not None and self._source_ids[row] != source_id:
+                    continue
+                value = group_values[group_ids[row]]
+                totals[value] = totals.get(value, 0) + count
+        return dict(sorted(totals.items()))
+
+
+# Aggregate counts of processed articles, updated as articles are ingested
+timeline_stats = TimelineStats()
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency for a cooldown period after repeated failures.
+    
+    With ``max_cooldown_seconds`` set, each consecutive re-opening doubles the
+    cooldown up to that ceiling (exponential backoff); a success resets it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, cooldown_seconds: float,
+                 max_cooldown_seconds: float = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._trips = 0
+        self._opened_at = None
+
+    @property
+    def current_cooldown(self) -> float:
+        if self.max_cooldown_seconds is None or self._trips <= 1:
+            return self.cooldown_seconds
+        return min(self.cooldown_seconds * 2 ** (self._trips - 1), self.max_cooldown_seconds)
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None and time.monotonic() - self._opened_at < self.current_cooldown
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted; after the cooldown one trial call is let through."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.current_cooldown:
+                # Half-open: allow a trial call and re-open immediately if it fails
+                self._opened_at = None
+                self._failures = self.failure_threshold - 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trips = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold and self._opened_at is None:
+                self._trips += 1
+                self._opened_at = time.monotonic()
+                logger.warning(f"Circuit breaker '{self.name}' opened for {self.current_cooldown}s "
+                               f"after {self._failures} consecutive failures")
+
+    def state(self) -> dict:
+        """Return a JSON-serializable summary for the metrics endpoint."""
+        return {
+            "open": self.is_open,
+            "consecutive_failures": self._failures,
+            "cooldown_seconds": self.current_cooldown
+        }
+
+
+class ArticleBroadcaster:
+    """Fans newly ingested or changed geocoded articles out to Server-Sent Events subscribers.
+    
+    Events get increasing ids and the most recent ones are kept so that a
+    reconnecting client can resume from its Last-Event-ID.
+    """
+
+    def __init__(self, history_size: int):
+        self._condition = threading.Condition()
+        self._events = deque(maxlen=history_size)  # (event_id, JSON payload)
+        self._published = {}  # article url -> (location_name, coords) last sent
+        self._last_id = 0
+
+    @property
+    def last_id(self) -> int:
+        with self._condition:
+            return self._last_id
+
+    @staticmethod
+    def _version(article) -> tuple:
+        return (article.location_name, tuple(article.coords or ()))
+
+    def prime(self, articles: list) -> None:
+        """Mark articles as already sent without queuing events, e.g. when loading a snapshot."""
+        with self._condition:
+            for article in articles:
+                self._published[article.url] = self._version(article)
+
+    def publish(self, articles: list) -> int:
+        """Queue an event for each article that is new or whose location changed."""
+        import json
+        
+        published = 0
+        with self._condition:
+            for article in articles:
+                version = self._version(article)
+                if self._published.get(article.url) == version:
+                    continue
+                self._published[article.url] = version
+                self._last_id += 1
+                self._events.append((self._last_id, json.dumps(article.to_dict(), default=str)))
+                published += 1
+            if published:
+                self._condition.notify_all()
+        if published:
+            logger.info(f"Broadcasting {published} new or changed articles to stream subscribers")
+        return published
+
+    def wait(self, last_id: int, timeout: float):
+        """Block until events newer than last_id exist or timeout passes.
+        
+        Returns the list of ``(event_id, payload)`` events, or None when the
+        client is too far behind for the kept history, or holds an id from an
+        earlier process (ids restart at 0), and must reload.
+        """
+        with self._condition:
+            if last_id > self._last_id:
+                return None
+            self._condition.wait_for(lambda: self._last_id > last_id, timeout=timeout)
+            if self._events and last_id < self._events[0][0] - 1:
+                return None
+            return [event for event in self._events if event[0] > last_id]
+
+
+# Pushes processed articles to open map pages through /api/stream
+article_broadcaster = ArticleBroadcaster(CONFIG['SSE_HISTORY_SIZE'])
+
+# Runtime counters exposed at /api/metrics
+metrics = {
+    "window_planner": {
+        "plans": 0,
+        "probes": 0,                  # NewsAPI pageSize=1 requests issued
+        "probe_failures": 0,          # probes that errored instead of returning a count
+        "local_hits": 0,              # windows chosen from ingested or cached data
+        "last_decision": None
+    },
+    "article_fetch": {
+        "fetched": 0,
+        "failed": 0,
+        "failure_seconds": 0.0,       # wall time spent on failed fetches
+        "negative_cache_hits": 0,     # skipped because the URL failed recently
+        "domain_skips": 0             # skipped because the domain's circuit is open
+    }
+}
+_metrics_lock = threading.Lock()
+
+def _count(section: str, key: str, amount=1) -> None:
+    with _metrics_lock:
+        metrics[section][key] += amount
+
+# Per-domain health of article publishers, keyed by host name
+domain_breakers = {}
+_domain_breakers_lock = threading.Lock()
+
+def _domain_breaker(domain: str) -> CircuitBreaker:
+    """Return the circuit breaker tracking a publisher domain, creating it on first use."""
+    with _domain_breakers_lock:
+        if domain not in domain_breakers:
+            domain_breakers[domain] = CircuitBreaker(
+                f"fetch:{domain}",
+                failure_threshold=CONFIG['FETCH_DOMAIN_FAILURE_THRESHOLD'],
+                cooldown_seconds=CONFIG['FETCH_DOMAIN_COOLDOWN'],
+                max_cooldown_seconds=CONFIG['FETCH_DOMAIN_MAX_COOLDOWN']
+            )
+        return domain_breakers[domain]
+
+def article_fetch_report() -> dict:
+    """Summarize article fetch counters, including an estimate of wall time saved by skipping."""
+    with _metrics_lock:
+        report = dict(metrics["article_fetch"])
+    skipped = report["negative_cache_hits"] + report["domain_skips"]
+    average_failure = report["failure_seconds"] / report["failed"] if report["failed"] else 0.0
+    report["estimated_seconds_saved"] = round(skipped * average_failure, 2)
+    report["failure_seconds"] = round(report["failure_seconds"], 2)
+    report["open_domains"] = sorted(domain for domain, breaker in list(domain_breakers.items()) if breaker.is_open)
+    return report
+
+def _record_fetch_failure(url: str, breaker: CircuitBreaker, started: float, domain_failure: bool) -> None:
+    """Negative-cache a failed URL and, for publisher-wide failures, count it against the domain."""
+    cache[f"fetch_failed_{url}"] = datetime.now() + timedelta(minutes=CONFIG['FETCH_NEGATIVE_CACHE_MINUTES'])
+    _count("article_fetch", "failed")
+    _count("article_fetch", "failure_seconds", time.monotonic() - started)
+    if domain_failure:
+        breaker.record_failure()
+
 def fetch_article_content(url: str) -> str:
-    """Fetch and extract text content from a news article URL."""
+    """Fetch and extract text content from a news article URL.
+    
+    URLs that failed recently and domains whose circuit is open are skipped
+    without a request, so blocking publishers don't cost a timeout per build.
+    """
+    from urllib.parse import urlparse
+    
+    import requests
+    from bs4 import BeautifulSoup
+    
+    negative_key = f"fetch_failed_{url}"
+    if cache.get(negative_key) and datetime.now() < cache[negative_key]:
+        logger.debug(f"Skipping recently failed URL {url}")
+        _count("article_fetch", "negative_cache_hits")
+        return ""
+    
+    domain = urlparse(url).netloc.lower()
+    breaker = _domain_breaker(domain)
+    if not breaker.allow():
+        logger.debug(f"Skipping {url}: circuit open for {domain}")
+        _count("article_fetch", "domain_skips")
+        return ""
+    
+    started = time.monotonic()
     try:
         headers = {"User-Agent": "Mozilla/5.0 (compatible; ICE-GIS-App/1.0)"}
         response = requests.get(
@@ -140,16 +546,26 @@ def fetch_article_content(url: str) -> str:
         
         text = soup.get_text(separator=" ", strip=True)
         logger.info(f"Successfully fetched content from {url}")
+        breaker.record_success()
+        _count("article_fetch", "fetched")
         return text.lower()
     except requests.exceptions.RequestException as e:
         logger.warning(f"Request error fetching {url}: {e}")
+        # Timeouts, connection errors, blocking (401/403/429) and server errors are
+        # publisher-wide; other client errors such as 404 only concern this URL
+        status = getattr(getattr(e, 'response', None), 'status_code', None)
+        domain_failure = status is None or status in (401, 403, 429) or status >= 500
+        _record_fetch_failure(url, breaker, started, domain_failure)
         return ""
     except Exception as e:
         logger.error(f"Unexpected error fetching {url}: {e}")
+        _record_fetch_failure(url, breaker, started, domain_failure=False)
         return ""
 
 def scrape_news(from_date: str = None, to_date: str = None) -> list:
     """Scrape REAL news articles from NewsAPI only - no fake data."""
+    import requests
+    
     # Create cache key based on date range
     cache_key = f"news_data_{from_date}_{to_date}"
     
@@ -161,22 +577,12 @@ def scrape_news(from_date: str = None, to_date: str = None) -> list:
     
     api_key = CONFIG['NEWS_API_KEY']
     all_articles = []
+    failed_queries = 0
     
-    # More targeted search queries for immigration enforcement
-    queries = [
-        "ICE raids OR ICE arrests",
-        "immigration enforcement", 
-        "border patrol arrests",
-        "ICE detention OR ICE operation",
-        "deportation raids",
-        "HSI arrests OR homeland security",
-        "CBP arrests OR customs border"
-    ]
-    
-    for query in queries:
+    for query in NEWS_QUERIES:
         try:
             # Build URL - get more articles per query
-            url = f"https://newsapi.org/v2/everything?q={query}&language=en&sortBy=publishedAt&pageSize=100&apiKey={api_key}"
+            url = f"{CONFIG['NEWS_API_URL']}?q={query}&language=en&sortBy=publishedAt&pageSize=100&apiKey={api_key}"
             
             if from_date:
                 url += f"&from={from_date}"
@@ -191,6 +597,7 @@ def scrape_news(from_date: str = None, to_date: str = None) -> list:
             
             if data.get("status") == "error":
                 logger.error(f"NewsAPI error: {data.get('message')}")
+                failed_queries += 1
                 continue
                 
             articles = data.get("articles", [])
@@ -202,7 +609,7 @@ def scrape_news(from_date: str = None, to_date: str = None) -> list:
                     continue
                 
                 # Skip duplicates
-                if any(existing["url"] == article["url"] for existing in all_articles):
+                if any(existing.url == article["url"] for existing in all_articles):
                     continue
                 
                 # Parse publication date
@@ -237,16 +644,15 @@ def scrape_news(from_date: str = None, to_date: str = None) -> list:
                 if not any(term in title_lower or term in description_lower for term in relevant_terms):
                     continue
                 
-                all_articles.append({
-                    "title": article["title"],
-                    "url": article["url"],
-                    "location": None,  # Will be extracted later
-                    "published_at": published_at,
-                    "date": formatted_date,
-                    "description": article.get("description", "")[:300] + "..." if article.get("description") else "",
-                    "source": article.get("source", {}).get("name", "Unknown"),
-                    "content": article.get("content", "")  # Sometimes has more text
-                })
+                all_articles.append(Article(
+                    title=article["title"],
+                    url=article["url"],
+                    published_at=published_at,
+                    date=formatted_date,
+                    description=article.get("description", "")[:300] + "..." if article.get("description") else "",
+                    source=article.get("source", {}).get("name", "Unknown"),
+                    content=article.get("content", "")  # Sometimes has more text
+                ))
             
             # Rate limiting
             import time
@@ -254,9 +660,11 @@ def scrape_news(from_date: str = None, to_date: str = None) -> list:
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error for query '{query}': {e}")
+            failed_queries += 1
             continue
         except Exception as e:
             logger.error(f"Error processing query '{query}': {e}")
+            failed_queries += 1
             continue
     
     # Remove duplicates and sort by date
@@ -264,21 +672,39 @@ def scrape_news(from_date: str = None, to_date: str = None) -> list:
     seen_urls = set()
     
     for article in all_articles:
-        if article["url"] not in seen_urls:
+        if article.url not in seen_urls:
             unique_articles.append(article)
-            seen_urls.add(article["url"])
+            seen_urls.add(article.url)
     
     # Sort by date (newest first)
-    unique_articles.sort(key=lambda x: x['date'], reverse=True)
+    unique_articles.sort(key=lambda x: x.date, reverse=True)
     
     logger.info(f"Successfully retrieved {len(unique_articles)} unique real articles from NewsAPI")
     
     # Update cache
+    _evict_expired_scrapes()
     cache[cache_key] = unique_articles
     cache[f'{cache_key}_updated'] = datetime.now()
+    cache[f'{cache_key}_failed_queries'] = failed_queries
     
     return unique_articles
 
+def _evict_expired_scrapes() -> None:
+    """Drop scrape results past CACHE_DURATION_MINUTES so their article bodies are freed."""
+    cutoff = datetime.now() - timedelta(minutes=CONFIG['CACHE_DURATION_MINUTES'])
+    for key in list(cache):
+        if not (key.startswith('news_data_') and key.endswith('_updated')):
+            continue
+        updated = cache.get(key)
+        if updated is not None and updated < cutoff:
+            base = key[:-len('_updated')]
+            for suffix in ('', '_updated', '_failed_queries'):
+                cache.pop(f"{base}{suffix}", None)
+
+def scrape_failed(from_date: str = None, to_date: str = None) -> bool:
+    """Return True if the last scrape of this window got no answer from any NewsAPI query."""
+    return cache.get(f"news_data_{from_date}_{to_date}_failed_queries") == len(NEWS_QUERIES)
+
 def create_error_map_html(error_message: str) -> str:
     """Create a simple error map when no real articles are found."""
     html = f"""
@@ -307,22 +733,70 @@ def create_error_map_html(error_message: str) -> str:
 
 # NO FALLBACK DATA - Use only real articles from NewsAPI
 
-def geocode_location(location_name: str) -> list:
-    """Geocode a location name to coordinates with caching and fallback."""
-    # Create cache key
+# Long-lived geocoding client shared by every lookup in the process
+_geocoder = None
+_geocoder_lock = threading.Lock()
+
+geocoder_breaker = CircuitBreaker(
+    'geocoder',
+    failure_threshold=CONFIG['GEOCODER_BREAKER_THRESHOLD'],
+    cooldown_seconds=CONFIG['GEOCODER_BREAKER_COOLDOWN']
+)
+
+def _build_geolocator():
+    """Create the geopy geocoder for the configured backend and URL."""
+    from urllib.parse import urlparse
+    
+    from geopy.geocoders import Nominatim, Photon
+    
+    backend = CONFIG['GEOCODER_BACKEND'].lower()
+    options = {"user_agent": "ice_gis_app/1.0", "timeout": CONFIG['GEOCODER_TIMEOUT']}
+    if CONFIG['GEOCODER_URL']:
+        parsed = urlparse(CONFIG['GEOCODER_URL'])
+        options["domain"] = parsed.netloc + parsed.path.rstrip('/')
+        options["scheme"] = parsed.scheme or "https"
+    
+    if backend == 'photon':
+        return Photon(**options)
+    if backend == 'nominatim':
+        return Nominatim(**options)
+    raise ValueError(f"Unknown GEOCODER_BACKEND '{CONFIG['GEOCODER_BACKEND']}' (expected nominatim or photon)")
+
+def _get_geocoder():
+    """Return the shared rate-limited geocode callable, creating it on first use."""
+    global _geocoder
+    with _geocoder_lock:
+        if _geocoder is None:
+            from geopy.extra.rate_limiter import RateLimiter
+            
+            geolocator = _build_geolocator()
+            logger.info(f"Using {CONFIG['GEOCODER_BACKEND']} geocoder at "
+                        f"{CONFIG['GEOCODER_URL'] or 'its public endpoint'}")
+            _geocoder = RateLimiter(
+                geolocator.geocode, 
+                min_delay_seconds=CONFIG['RATE_LIMIT_DELAY'], 
+                max_retries=CONFIG['GEOCODER_MAX_RETRIES'],
+                swallow_exceptions=False  # let failures reach the circuit breaker
+            )
+    return _geocoder
+
+def reset_geocoder() -> None:
+    """Drop the shared geocoder so the next lookup picks up changed CONFIG values."""
+    global _geocoder
+    with _geocoder_lock:
+        _geocoder = None
+
+def _geocode_uncached(location_name: str) -> list:
+    """Look up a location with the shared geocoder and cache the result."""
     cache_key = f"geocode_{location_name.lower()}"
+    fallback_coords = [39.8283, -98.5795]  # US geographic center
     
-    # Check if we have cached coordinates
-    if cache_key in cache:
-        logger.debug(f"Using cached coordinates for {location_name}")
-        return cache[cache_key]
+    if not geocoder_breaker.allow():
+        # Not cached, so the location is retried once the geocoder recovers
+        logger.debug(f"Geocoder circuit open, using US center for '{location_name}'")
+        return fallback_coords
     
-    geolocator = Nominatim(user_agent="ice_gis_app/1.0")
-    geocode = RateLimiter(
-        geolocator.geocode, 
-        min_delay_seconds=CONFIG['RATE_LIMIT_DELAY'], 
-        max_retries=3
-    )
+    geocode = _get_geocoder()
     
     try:
         # Normalize location name using location_map
@@ -338,6 +812,7 @@ def geocode_location(location_name: str) -> list:
             normalized_name += ", United States"
         
         location = geocode(normalized_name)
+        geocoder_breaker.record_success()
         if location:
             coords = [location.latitude, location.longitude]
             cache[cache_key] = coords  # Cache the result
@@ -345,80 +820,151 @@ def geocode_location(location_name: str) -> list:
             return coords
         
         logger.warning(f"Geocoding failed for '{location_name}', using US center")
-        fallback_coords = [39.8283, -98.5795]  # US geographic center
         cache[cache_key] = fallback_coords
         return fallback_coords
         
     except Exception as e:
+        # Errors are not cached so the location is retried on a later build
         logger.error(f"Geocoding error for '{location_name}': {e}")
-        fallback_coords = [39.8283, -98.5795]
-        cache[cache_key] = fallback_coords
+        geocoder_breaker.record_failure()
         return fallback_coords
 
-def extract_location_from_article(article_data: dict) -> str:
-    """Extract location from real article data using improved parsing and prioritization."""
-    title = article_data.get("title", "")
-    description = article_data.get("description", "")
-    content = article_data.get("content", "")
-    url = article_data.get("url", "")
+def geocode_location(location_name: str) -> list:
+    """Geocode a location name to coordinates with caching and fallback."""
+    # Create cache key
+    cache_key = f"geocode_{location_name.lower()}"
+    
+    # Check if we have cached coordinates
+    if cache_key in cache:
+        logger.debug(f"Using cached coordinates for {location_name}")
+        return cache[cache_key]
+    
+    return _geocode_uncached(location_name)
+
+def geocode_locations(location_names) -> dict:
+    """Geocode a batch of location names, sending only cache misses to the geocoder."""
+    unique_names = set(location_names)
+    results = {}
+    misses = {}  # cache key -> names sharing it
+    for location_name in unique_names:
+        cache_key = f"geocode_{location_name.lower()}"
+        if cache_key in cache:
+            results[location_name] = cache[cache_key]
+        else:
+            misses.setdefault(cache_key, []).append(location_name)
+    
+    logger.info(f"Batch geocoding {len(unique_names)} unique locations: "
+                f"{len(results)} cached, {len(misses)} to look up")
+    if not misses:
+        return results
+    
+    lookups = [names[0] for names in misses.values()]
+    workers = max(1, min(CONFIG['GEOCODE_CONCURRENCY'], len(lookups)))
+    if workers == 1:
+        resolved = [_geocode_uncached(name) for name in lookups]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            resolved = list(executor.map(_geocode_uncached, lookups))
+    
+    for names, coords in zip(misses.values(), resolved):
+        for location_name in names:
+            results[location_name] = coords
+    return results
+
+# Location extraction patterns and gazetteer, compiled once per process
+# (and therefore once per extraction worker)
+_STATE_ABBREVS = r'\b(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\b'
+_CITY_STATE_PATTERN = re.compile(rf'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*{_STATE_ABBREVS}')
+_TITLE_LOCATION_PATTERNS = [
+    re.compile(r'\b(?:in|at|near|from)\s+([A-Za-z][A-Za-z\s]+?)(?:,|\s+(?:raids?|arrests?|operations?|detention|enforcement|ICE|immigration))', re.IGNORECASE),
+    re.compile(r'\b([A-Za-z][A-Za-z\s]+?)(?:,|\s+)(?:raids?|arrests?|operations?|detention|enforcement|ICE)', re.IGNORECASE),
+    re.compile(r'\b([A-Za-z][A-Za-z\s]+?)\s+(?:ICE|immigration|enforcement|raids?|arrests?)', re.IGNORECASE)
+]
+_DIRECTION_PATTERNS = [
+    re.compile(r'\bin\s+([a-z]+(?:\s+[a-z]+)*)\b'),
+    re.compile(r'\bnear\s+([a-z]+(?:\s+[a-z]+)*)\b'),
+    re.compile(r'\bfrom\s+([a-z]+(?:\s+[a-z]+)*)\b'),
+    re.compile(r'\bout(?:side)?\s+of\s+([a-z]+(?:\s+[a-z]+)*)\b')
+]
+_CONTEXT_WORDS = ['raids', 'arrests', 'operation', 'detention', 'enforcement', 'ice']
+_MAJOR_CITIES = {
+    "houston": "houston", "dallas": "dallas", "chicago": "chicago", 
+    "los angeles": "los angeles", "new york": "new york", "miami": "miami",
+    "denver": "denver", "phoenix": "phoenix", "atlanta": "atlanta",
+    "boston": "boston", "seattle": "washington state", "portland": "portland"
+}
+_STATE_LOCATIONS = {
+    "texas": "dallas", "california": "los angeles", "florida": "miami", 
+    "new york": "new york", "illinois": "chicago", "arizona": "phoenix",
+    "colorado": "denver", "washington": "washington state",
+    "missouri": "liberty", "maryland": "hyattsville"
+}
+# (key, full location, lowercased full location, city name) for every location_map entry
+_GAZETTEER = [
+    (key, full_location, full_location.lower(), full_location.lower().split(", ")[0])
+    for key, full_location in location_map.items()
+]
+
+def _article_text(article_data: Article) -> str:
+    """Combine an article's text fields, fetching the page body when they are too short."""
+    title = article_data.title or ""
+    description = article_data.description or ""
+    content = article_data.content or ""
     
     # Combine all text sources
     all_text = f"{title} {description} {content}".lower()
     
-    logger.debug(f"Extracting location from: {title}")
-    
     # First, try to get more content from the URL if needed
     if len(all_text) < 200:  # If we don't have much text, try to fetch more
-        fetched_content = fetch_article_content(url)
+        fetched_content = fetch_article_content(article_data.url or "")
         all_text += f" {fetched_content}"
+    return all_text
+
+def score_location(title: str, all_text: str) -> tuple:
+    """Pick the best location key for an article's title and lowercased text.
+    
+    Returns ``(location_key, score)``. Explicit title and "City, ST" matches
+    score 100 and 90, keyword matches score by specificity, and the weaker
+    fallbacks score 3 or less.
+    """
+    logger.debug(f"Extracting location from: {title}")
     
     # Priority 1: Look for explicit location patterns in title first (most reliable)
     title_lower = title.lower()
     
     # Look for "in [City]" or "at [City]" patterns in the title
-    import re
-    location_patterns = [
-        r'\b(?:in|at|near|from)\s+([A-Za-z][A-Za-z\s]+?)(?:,|\s+(?:raids?|arrests?|operations?|detention|enforcement|ICE|immigration))',
-        r'\b([A-Za-z][A-Za-z\s]+?)(?:,|\s+)(?:raids?|arrests?|operations?|detention|enforcement|ICE)',
-        r'\b([A-Za-z][A-Za-z\s]+?)\s+(?:ICE|immigration|enforcement|raids?|arrests?)'
-    ]
-    
-    for pattern in location_patterns:
-        matches = re.findall(pattern, title, re.IGNORECASE)
+    for pattern in _TITLE_LOCATION_PATTERNS:
+        matches = pattern.findall(title)
         for match in matches:
             location_candidate = match.strip().lower()
             # Check if this matches any of our known locations
-            for key, full_location in location_map.items():
+            for key, full_location, _, city_name in _GAZETTEER:
                 if key in location_candidate or location_candidate in key:
                     logger.info(f"Found title location pattern: '{match}' -> {key}")
-                    return key
+                    return key, 100
                 # Also check city names
-                city_name = full_location.split(',')[0].lower()
                 if city_name in location_candidate or location_candidate in city_name:
                     if len(location_candidate) > 3:  # Avoid very short matches
                         logger.info(f"Found title city match: '{match}' -> {key}")
-                        return key
+                        return key, 100
     
     # Priority 2: Look for specific location context in full text
     # Look for "City, State" patterns first (most reliable)
-    state_abbrevs = r'\b(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\b'
-    city_state_pattern = rf'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*{state_abbrevs}'
-    
-    matches = re.findall(city_state_pattern, all_text.title())
-    for city, state in matches:
+    city_state_matches = _CITY_STATE_PATTERN.findall(all_text.title())
+    for city, state in city_state_matches:
         city_lower = city.lower()
         state_lower = state.lower()
         # Look for exact matches in our location map
-        for key, full_location in location_map.items():
-            full_lower = full_location.lower()
+        for key, full_location, full_lower, _ in _GAZETTEER:
             if city_lower in full_lower and state_lower in full_lower:
                 logger.info(f"Found City,State pattern: {city}, {state} -> {key}")
-                return key
+                return key, 90
     
     # Priority 3: Look for location keywords from our map (but be more selective)
     # First pass: exact matches and longer location names (more reliable)
     location_scores = []
-    for key, full_location in location_map.items():
+    for key, full_location, _, city_name in _GAZETTEER:
         score = 0
         
         # Higher score for longer, more specific matches
@@ -430,22 +976,18 @@ def extract_location_from_article(article_data: dict) -> str:
                 score += 10
                 
             # Bonus for context words nearby
-            context_words = ['raids', 'arrests', 'operation', 'detention', 'enforcement', 'ice']
-            for word in context_words:
+            for word in _CONTEXT_WORDS:
                 if word in all_text and abs(all_text.find(key) - all_text.find(word)) < 50:
                     score += 2
                     
             location_scores.append((score, key, full_location))
         
         # Also check city names from full location
-        location_parts = full_location.lower().split(", ")
-        if len(location_parts) >= 1:
-            city_name = location_parts[0]
-            if city_name in all_text and len(city_name) > 4:  # Only longer city names
-                city_score = len(city_name)
-                if city_name in title_lower:
-                    city_score += 5
-                location_scores.append((city_score, key, full_location))
+        if city_name in all_text and len(city_name) > 4:  # Only longer city names
+            city_score = len(city_name)
+            if city_name in title_lower:
+                city_score += 5
+            location_scores.append((city_score, key, full_location))
     
     # Return the highest scoring location
     if location_scores:
@@ -453,104 +995,205 @@ def extract_location_from_article(article_data: dict) -> str:
         best_score, best_key, best_location = location_scores[0]
         if best_score > 3:  # Only return if we have reasonable confidence
             logger.info(f"Found best location match: '{best_key}' -> {best_location} (score: {best_score})")
-            return best_key
+            return best_key, best_score
     
     # Look for specific location patterns in the text
-    import re
-    
     # City, State patterns
-    state_abbrevs = r'\b(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\b'
-    city_state_pattern = rf'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*{state_abbrevs}'
-    
-    matches = re.findall(city_state_pattern, all_text.title())  # Use title case for proper matching
-    for city, state in matches:
+    for city, state in city_state_matches:
         city_lower = city.lower()
         # Check if this city matches our location map
-        for key, value in location_map.items():
+        for key, _, _, _ in _GAZETTEER:
             if city_lower in key or key in city_lower:
                 logger.info(f"Found location via regex: {city}, {state} -> {key}")
-                return key
+                return key, 3
     
     # Look for directional indicators with cities
-    direction_patterns = [
-        r'\bin\s+([a-z]+(?:\s+[a-z]+)*)\b',
-        r'\bnear\s+([a-z]+(?:\s+[a-z]+)*)\b',
-        r'\bfrom\s+([a-z]+(?:\s+[a-z]+)*)\b',
-        r'\bout(?:side)?\s+of\s+([a-z]+(?:\s+[a-z]+)*)\b'
-    ]
-    
-    for pattern in direction_patterns:
-        matches = re.findall(pattern, all_text)
+    for pattern in _DIRECTION_PATTERNS:
+        matches = pattern.findall(all_text)
         for match in matches:
             location_text = match.strip()
             # Check against our location map
-            for key in location_map.keys():
+            for key, _, _, _ in _GAZETTEER:
                 if key in location_text or location_text in key:
                     logger.info(f"Found directional location: {location_text} -> {key}")
-                    return key
+                    return key, 3
     
     # Look for major cities without directional indicators
-    major_cities = {
-        "houston": "houston", "dallas": "dallas", "chicago": "chicago", 
-        "los angeles": "los angeles", "new york": "new york", "miami": "miami",
-        "denver": "denver", "phoenix": "phoenix", "atlanta": "atlanta",
-        "boston": "boston", "seattle": "washington state", "portland": "portland"
-    }
-    
-    for city_name, location_key in major_cities.items():
+    for city_name, location_key in _MAJOR_CITIES.items():
         if city_name in all_text:
             logger.info(f"Found major city '{city_name}' -> {location_key}")
-            return location_key if location_key in location_map else city_name
+            return (location_key if location_key in location_map else city_name), 2
     
     # Look for state names
-    states = {
-        "texas": "dallas", "california": "los angeles", "florida": "miami", 
-        "new york": "new york", "illinois": "chicago", "arizona": "phoenix",
-        "colorado": "denver", "washington": "washington state",
-        "missouri": "liberty", "maryland": "hyattsville"
-    }
-    
-    for state_name, location_key in states.items():
+    for state_name, location_key in _STATE_LOCATIONS.items():
         if state_name in all_text:
             logger.info(f"Found state '{state_name}' -> {location_key}")
-            return location_key
+            return location_key, 1
     
     # Default fallback - return first location that makes sense
     logger.warning(f"No specific location found for: {title[:50]}...")
-    return "washington"  # Default to DC for federal immigration news
+    return "washington", 0  # Default to DC for federal immigration news
 
-def create_timeline_map() -> str:
-    """Create an interactive map with timeline functionality using REAL articles only."""
-    # Try different date ranges to find available articles
+def extract_location_from_article(article_data: Article) -> str:
+    """Extract location from real article data using improved parsing and prioritization."""
+    location_key, _ = score_location(article_data.title or "", _article_text(article_data))
+    return location_key
+
+def _init_extraction_worker() -> None:
+    """Prepare a pool worker; per-article info logging is too chatty across processes."""
+    if logger.getEffectiveLevel() < logging.WARNING:
+        logger.setLevel(logging.WARNING)
+
+def _score_location_pair(pair: tuple) -> tuple:
+    return score_location(*pair)
+
+def extract_locations(texts: list, workers: int = None) -> list:
+    """Score ``(title, all_text)`` pairs, returning ``(location_key, score)`` in input order.
+    
+    Large batches are chunked across a process pool; small ones run serially
+    since the pool start-up would cost more than it saves.
+    """
+    workers = workers or CONFIG['EXTRACTION_WORKERS'] or os.cpu_count() or 1
+    if workers <= 1 or len(texts) < CONFIG['PARALLEL_EXTRACTION_MIN_BATCH']:
+        return [score_location(title, all_text) for title, all_text in texts]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+    
+    chunksize = max(1, len(texts) // (workers * 4))
+    logger.info(f"Extracting locations for {len(texts)} articles across {workers} processes")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_extraction_worker) as executor:
+            return list(executor.map(_score_location_pair, texts, chunksize=chunksize))
+    except (OSError, BrokenProcessPool) as e:
+        # Also covers a worker dying mid-batch (e.g. OOM-killed); redo the whole batch here
+        logger.warning(f"Process pool unavailable ({e}), extracting serially")
+        return [score_location(title, all_text) for title, all_text in texts]
+
+def _probe_news_window(from_date: str, to_date: str):
+    """Return NewsAPI's totalResults for all queries in a window with one pageSize=1 request.
+    
+    Returns None when the probe itself fails.
+    """
+    import requests
+    
+    cache_key = f"news_probe_{from_date}_{to_date}"
+    if (cache_key in cache and cache.get(f'{cache_key}_updated') and 
+        datetime.now() - cache[f'{cache_key}_updated'] < timedelta(minutes=CONFIG['CACHE_DURATION_MINUTES'])):
+        return cache[cache_key]
+    
+    params = {
+        "q": " OR ".join(f"({query})" for query in NEWS_QUERIES),
+        "language": "en",
+        "pageSize": 1,
+        "apiKey": CONFIG['NEWS_API_KEY']
+    }
+    if from_date:
+        params["from"] = from_date
+    if to_date:
+        params["to"] = to_date
+    
+    _count("window_planner", "probes")
+    try:
+        response = requests.get(CONFIG['NEWS_API_URL'], params=params, timeout=CONFIG['REQUEST_TIMEOUT'])
+        response.raise_for_status()
+        data = response.json()
+        if data.get("status") == "error":
+            logger.error(f"NewsAPI probe error: {data.get('message')}")
+            _count("window_planner", "probe_failures")
+            return None
+        total = int(data.get("totalResults", 0))
+    except Exception as e:
+        logger.error(f"NewsAPI probe failed for {from_date} to {to_date}: {e}")
+        _count("window_planner", "probe_failures")
+        return None
+    
+    cache[cache_key] = total
+    cache[f'{cache_key}_updated'] = datetime.now()
+    return total
+
+def plan_date_window(exclude=()) -> dict:
+    """Pick the smallest date window that has articles, without running full scrapes.
+    
+    Candidate windows are tried smallest first: last 30 days, last 60 days,
+    since inauguration, then no date filter. A window is chosen when locally
+    ingested or cached articles fall in it, or when a single cheap NewsAPI
+    probe reports results for it. Windows whose from_date is in ``exclude``
+    (already scraped without results) are skipped. Returns the decision:
+    ``window``, ``from_date`` and ``to_date`` (both None for the unfiltered
+    window), ``basis``, and ``probe_total``, which is the probe's result
+    count when a probe chose the window and None otherwise.
+    """
     to_date = datetime.now().strftime('%Y-%m-%d')
+    candidates = [
+        ("last 30 days", (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')),
+        ("last 60 days", (datetime.now() - timedelta(days=60)).strftime('%Y-%m-%d')),
+        ("since inauguration", CONFIG['TRUMP_INAUGURATION']),  # may fail due to API limits
+    ]
     
-    # First try: Last 30 days (most likely to have data)
-    from_date_30 = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-    logger.info(f"Trying last 30 days: {from_date_30} to {to_date}")
-    all_news = scrape_news(from_date_30, to_date)
+    decision = None
+    probes_empty = 0
+    for label, from_date in candidates:
+        if from_date in exclude:
+            continue
+        if timeline_stats.query('date', from_date=from_date, to_date=to_date) or cache.get(f"news_data_{from_date}_{to_date}"):
+            decision = {"window": label, "from_date": from_date, "to_date": to_date, "basis": "local data",
+                        "probe_total": None}
+            _count("window_planner", "local_hits")
+            break
+        total = _probe_news_window(from_date, to_date)
+        if total is None:
+            # Can't tell; let the full scrape try this window rather than probing further
+            decision = {"window": label, "from_date": from_date, "to_date": to_date, "basis": "probe failed",
+                        "probe_total": None}
+            break
+        if total > 0:
+            decision = {"window": label, "from_date": from_date, "to_date": to_date,
+                        "basis": f"probe found {total} results", "probe_total": total}
+            break
+        probes_empty += 1
+        logger.info(f"Window planner: no results {label} ({from_date} to {to_date})")
     
-    # If no articles in last 30 days, try last 60 days
-    if not all_news:
-        from_date_60 = (datetime.now() - timedelta(days=60)).strftime('%Y-%m-%d')
-        logger.info(f"Trying last 60 days: {from_date_60} to {to_date}")
-        all_news = scrape_news(from_date_60, to_date)
+    if decision is None:
+        # Get any recent articles
+        basis = f"{probes_empty} probes empty"
+        if exclude:
+            basis += f", {len(exclude)} narrower windows scraped empty"
+        decision = {"window": "no date filter", "from_date": None, "to_date": None, "basis": basis,
+                    "probe_total": None}
     
-    # If still no articles, try inauguration date (may fail due to API limits)
-    if not all_news:
-        from_date_inauguration = CONFIG['TRUMP_INAUGURATION']  # 2025-01-20
-        logger.info(f"Trying from inauguration: {from_date_inauguration} to {to_date}")
-        all_news = scrape_news(from_date_inauguration, to_date)
+    logger.info(f"Window planner chose {decision['window']} "
+                f"({decision['from_date']} to {decision['to_date']}): {decision['basis']}")
+    _count("window_planner", "plans")
+    with _metrics_lock:
+        metrics["window_planner"]["last_decision"] = {**decision, "decided_at": datetime.now().isoformat()}
+    return decision
+
+def build_timeline_articles() -> list:
+    """Fetch, locate and geocode REAL articles for the timeline.
     
-    # If still no articles, try without date filter (get recent articles)
-    if not all_news:
-        logger.info("Trying without date filter to get any recent articles")
-        all_news = scrape_news()  # No date filter
+    Returns None when NewsAPI has no articles at all, otherwise the list of
+    articles that could be processed (possibly empty).
+    """
+    # Pick the date range once and run a single full scrape for it. The plan
+    # rests on a combined probe, so when the probe found results but the
+    # relevance filter and de-duplication left none, widen to the next window.
+    # A failed probe or scrape is not retried wider: it would fail the same way.
+    tried = []
+    while True:
+        decision = plan_date_window(exclude=tried)
+        from_date, to_date = decision["from_date"], decision["to_date"]
+        all_news = scrape_news(from_date, to_date)
+        if all_news or from_date is None or not decision["probe_total"] or scrape_failed(from_date, to_date):
+            break
+        logger.info(f"Probe found results from {from_date} to {to_date} but none were usable; trying a wider window")
+        tried.append(from_date)
     
     logger.info(f"Retrieved {len(all_news)} total REAL articles")
     
     if not all_news:
         logger.error("No real articles found! Check NewsAPI configuration.")
-        return create_error_map_html("No real articles found from NewsAPI")
+        return None
     
     # Use the real articles we found
     news = all_news
@@ -559,35 +1202,308 @@ def create_timeline_map() -> str:
     processed_articles = []
     used_coords = []
     
+    # Extract every location first so the whole build is geocoded in one batch.
+    # Articles already on the latest map keep their earlier result; the rest
+    # are gathered and scored together.
+    with _latest_lock:
+        previous = {article.url: (article.location_name, article.coords) for article in _latest["articles"] or []}
+    located_articles = []
+    pending = []
     for i, item in enumerate(news):
+        if item.url in previous:
+            located_articles.append((i, item, previous[item.url][0]))
+            continue
         try:
-            # Extract location using the new method
-            location_name = extract_location_from_article(item)
-            coords = geocode_location(location_name)
-            
-            # Offset coordinates if they're too close to existing markers
-            original_coords = coords[:]
-            offset_multiplier = 1
-            while coords in used_coords:
-                coords = [coords[0] + (0.01 * offset_multiplier), coords[1] + (0.01 * offset_multiplier)]
-                offset_multiplier += 1
+            pending.append((i, item, (item.title or "", _article_text(item))))
+        except Exception as e:
+            logger.error(f"Error extracting location for real article {i}: {e}")
+            continue
+    
+    fetch_report = article_fetch_report()
+    logger.info(f"Article fetches so far: {fetch_report['fetched']} fetched, {fetch_report['failed']} failed, "
+                f"{fetch_report['negative_cache_hits']} negative-cache hits, {fetch_report['domain_skips']} "
+                f"domain skips (~{fetch_report['estimated_seconds_saved']}s saved)")
+    
+    if pending:
+        scores = extract_locations([texts for _, _, texts in pending])
+        for (i, item, _), (location_name, _) in zip(pending, scores):
+            located_articles.append((i, item, location_name))
+        located_articles.sort(key=lambda entry: entry[0])
+    
+    coords_by_location = geocode_locations(name for _, _, name in located_articles)
+    
+    # Markers already on the map keep their offset position, so an article
+    # arriving at the same location takes the next free slot instead of
+    # shifting (and re-broadcasting) every older marker there
+    kept_coords = {}
+    for i, item, location_name in located_articles:
+        previous_location, previous_coords = previous.get(item.url, (None, None))
+        base = coords_by_location.get(location_name)
+        if previous_location != location_name or not previous_coords or not base:
+            continue
+        lat_offset, lng_offset = previous_coords[0] - base[0], previous_coords[1] - base[1]
+        if abs(lat_offset - lng_offset) < 1e-9 and lat_offset > -1e-9 and previous_coords not in used_coords:
+            kept_coords[i] = list(previous_coords)
+            used_coords.append(kept_coords[i])
+    
+    for i, item, location_name in located_articles:
+        try:
+            coords = kept_coords.get(i)
+            if coords is None:
+                coords = coords_by_location[location_name]
                 
-            used_coords.append(coords)
+                # Offset coordinates if they're too close to existing markers
+                offset_multiplier = 1
+                while coords in used_coords:
+                    coords = [coords[0] + (0.01 * offset_multiplier), coords[1] + (0.01 * offset_multiplier)]
+                    offset_multiplier += 1
+                    
+                used_coords.append(coords)
+            timeline_stats.record(item.url, item.date, location_name, item.source)
             
-            processed_articles.append({
-                **item,
-                'location_name': location_name,
-                'coords': coords,
-                'id': f'marker_{i}'
-            })
+            processed_articles.append(item.located(location_name, coords, f'marker_{i}'))
             
         except Exception as e:
             logger.error(f"Error processing real article {i}: {e}")
             continue
     
+    return processed_articles
+
+# Versioned binary snapshot of processed articles for instant warm starts.
+#
+# Layout (little-endian): a 40-byte header, a 16-byte table-size block, then
+# the payload sections, each padded to 8 bytes. Every section therefore starts
+# at an 8-aligned file offset (the first at 56), so the numeric columns can be
+# cast in place from a page-aligned memory map:
+#   latitude f8[n] | longitude f8[n] | date, location, source index u4[n] each |
+#   string offsets u4[strings + 1] | UTF-8 string blob
+# Strings are the date, location and source tables followed by five fields
+# (title, url, published_at, description, id) per article. The header carries
+# the schema version and a CRC32 of everything after it.
+SNAPSHOT_MAGIC = b"ICESNAP\0"
+SNAPSHOT_VERSION = 2
+_SNAPSHOT_HEADER = struct.Struct('<8sHHIIdQ4x')  # magic, version, reserved, articles, crc32, created_at, payload bytes
+_SNAPSHOT_TABLES = struct.Struct('<IIII')      # dates, locations, sources, strings
+_SNAPSHOT_ARTICLE_FIELDS = ('title', 'url', 'published_at', 'description', 'id')
+
+def _pad8(data: bytes) -> bytes:
+    return data + b'\0' * (-len(data) % 8)
+
+def save_snapshot(articles: list, path: str) -> None:
+    """Write processed articles to a snapshot file atomically."""
+    tables = {'date': {}, 'location': {}, 'source': {}}
+    columns = {'date': array('I'), 'location': array('I'), 'source': array('I')}
+    latitudes, longitudes = array('d'), array('d')
+    for article in articles:
+        for column, value in (('date', article.date), ('location', article.location_name), ('source', article.source)):
+            columns[column].append(tables[column].setdefault(value, len(tables[column])))
+        latitudes.append(article.coords[0])
+        longitudes.append(article.coords[1])
+    
+    strings = list(tables['date']) + list(tables['location']) + list(tables['source'])
+    for article in articles:
+        strings.extend(getattr(article, field) or "" for field in _SNAPSHOT_ARTICLE_FIELDS)
+    encoded = [value.encode('utf-8') for value in strings]
+    offsets = array('I', [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    
+    for column in (latitudes, longitudes, *columns.values(), offsets):
+        if sys.byteorder != 'little':
+            column.byteswap()
+    payload = b''.join([
+        _SNAPSHOT_TABLES.pack(len(tables['date']), len(tables['location']), len(tables['source']), len(strings)),
+        _pad8(latitudes.tobytes()), _pad8(longitudes.tobytes()),
+        _pad8(columns['date'].tobytes()), _pad8(columns['location'].tobytes()), _pad8(columns['source'].tobytes()),
+        _pad8(offsets.tobytes()), b''.join(encoded)
+    ])
+    header = _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(articles),
+                                   zlib.crc32(payload), time.time(), len(payload))
+    
+    import tempfile
+    
+    # A unique temp file in the target directory keeps the rename atomic
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f"{name}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    logger.info(f"Saved snapshot of {len(articles)} articles to {path} ({len(header) + len(payload)} bytes)")
+
+def load_snapshot(path: str):
+    """Load articles from a snapshot file via a memory map.
+    
+    Returns ``(articles, created_at)``, or None when the file is missing,
+    from another schema version, truncated or fails its checksum.
+    """
+    import mmap
+    
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _SNAPSHOT_HEADER.size:
+                logger.warning(f"Ignoring snapshot {path}: file is truncated")
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not open snapshot {path}: {e}")
+        return None
+    
+    started = time.perf_counter()
+    views = [memoryview(mapped)]  # every view must be released before the map closes
+    try:
+        magic, version, _, count, checksum, created_at, payload_size = _SNAPSHOT_HEADER.unpack_from(views[0])
+        payload = views[0][_SNAPSHOT_HEADER.size:]
+        views.append(payload)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            logger.warning(f"Ignoring snapshot {path}: schema version {version}, expected {SNAPSHOT_VERSION}")
+            return None
+        if len(payload) != payload_size or zlib.crc32(payload) != checksum:
+            logger.warning(f"Ignoring snapshot {path}: checksum mismatch or truncated file")
+            return None
+        if sys.byteorder != 'little':
+            logger.warning(f"Ignoring snapshot {path}: big-endian hosts are not supported")
+            return None
+        
+        date_count, location_count, source_count, string_count = _SNAPSHOT_TABLES.unpack_from(payload)
+        position = _SNAPSHOT_TABLES.size
+        
+        def section(item_size: int, length: int, typecode: str):
+            nonlocal position
+            size = item_size * length
+            raw = payload[position:position + size]
+            values = raw.cast(typecode)
+            views.extend((raw, values))
+            position += size + (-size % 8)
+            return values
+        
+        latitudes = section(8, count, 'd')
+        longitudes = section(8, count, 'd')
+        date_ids = section(4, count, 'I')
+        location_ids = section(4, count, 'I')
+        source_ids = section(4, count, 'I')
+        offsets = section(4, string_count + 1, 'I')
+        blob = payload[position:]
+        views.append(blob)
+        
+        def string(index: int) -> str:
+            return str(blob[offsets[index]:offsets[index + 1]], 'utf-8')
+        
+        dates = [sys.intern(string(i)) for i in range(date_count)]
+        locations = [sys.intern(string(date_count + i)) for i in range(location_count)]
+        sources = [string(date_count + location_count + i) for i in range(source_count)]
+        
+        articles = []
+        first = date_count + location_count + source_count
+        field_count = len(_SNAPSHOT_ARTICLE_FIELDS)
+        for i in range(count):
+            base = first + i * field_count
+            title, url, published_at, description, marker_id = (string(base + j) for j in range(field_count))
+            article = Article(title, url, published_at, dates[date_ids[i]], description, sources[source_ids[i]], None)
+            article.set_location(locations[location_ids[i]], [latitudes[i], longitudes[i]], marker_id)
+            articles.append(article)
+    except (struct.error, ValueError, TypeError, IndexError) as e:
+        logger.warning(f"Ignoring snapshot {path}: {e}")
+        return None
+    finally:
+        for view in reversed(views):
+            view.release()
+        mapped.close()
+    
+    logger.info(f"Loaded snapshot of {len(articles)} articles from {path} "
+                f"in {(time.perf_counter() - started) * 1000:.1f}ms")
+    return articles, datetime.fromtimestamp(created_at)
+
+# Latest processed articles, from the last build or the boot snapshot
+_latest = {"articles": None, "built_at": None, "html": None}
+_latest_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+_build_lock = threading.RLock()  # one build at a time, whether from a request, refresh or ingestion
+
+def _set_latest_articles(articles: list, built_at: datetime) -> None:
+    with _latest_lock:
+        _latest.update(articles=articles, built_at=built_at, html=None)
+
+def warm_start() -> bool:
+    """Load the snapshot once so the first request can be served without a rebuild."""
+    with _latest_lock:
+        if _latest["articles"] is not None or not CONFIG['SNAPSHOT_PATH']:
+            return _latest["articles"] is not None
+    snapshot = load_snapshot(CONFIG['SNAPSHOT_PATH'])
+    if snapshot is None:
+        return False
+    articles, created_at = snapshot
+    for article in articles:
+        timeline_stats.record(article.url, article.date, article.location_name, article.source)
+    # Pages rendered from the snapshot already contain these, so there is nothing to stream
+    article_broadcaster.prime(articles)
+    with _latest_lock:
+        if _latest["articles"] is None:
+            _latest.update(articles=articles, built_at=created_at, html=None)
+    return True
+
+def refresh_in_background() -> bool:
+    """Rebuild the timeline on a background thread unless a rebuild is already running."""
+    if not _refresh_lock.acquire(blocking=False):
+        return False
+    
+    def run():
+        try:
+            create_timeline_map()
+        except Exception as e:
+            logger.error(f"Background refresh failed: {e}")
+        finally:
+            _refresh_lock.release()
+    
+    threading.Thread(target=run, name="refresh", daemon=True).start()
+    return True
+
+def latest_timeline_html():
+    """Return the page for the latest processed articles and whether they are stale, or (None, True)."""
+    with _latest_lock:
+        articles, built_at = _latest["articles"], _latest["built_at"]
+        if not articles:
+            return None, True
+        if _latest["html"] is None:
+            _latest["html"] = create_timeline_html(
+                articles,
+                stream_url='/api/stream',
+                last_event_id=article_broadcaster.last_id
+            )
+        stale = datetime.now() - built_at >= timedelta(minutes=CONFIG['CACHE_DURATION_MINUTES'])
+        return _latest["html"], stale
+
+def create_timeline_map() -> str:
+    """Create an interactive map with timeline functionality using REAL articles only."""
+    with _build_lock:
+        return _create_timeline_map()
+
+def _create_timeline_map() -> str:
+    processed_articles = build_timeline_articles()
+    
     # Create the HTML with timeline functionality - only if we have real articles
-    if processed_articles:
-        html_content = create_timeline_html(processed_articles)
+    if processed_articles is None:
+        processed_articles = []
+        html_content = create_error_map_html("No real articles found from NewsAPI")
+    elif processed_articles:
+        article_broadcaster.publish(processed_articles)
+        _set_latest_articles(processed_articles, datetime.now())
+        if CONFIG['SNAPSHOT_PATH']:
+            try:
+                save_snapshot(processed_articles, CONFIG['SNAPSHOT_PATH'])
+            except OSError as e:
+                logger.error(f"Could not save snapshot: {e}")
+        html_content = create_timeline_html(
+            processed_articles,
+            stream_url='/api/stream',
+            last_event_id=article_broadcaster.last_id
+        )
     else:
         html_content = create_error_map_html("No real articles could be processed with valid locations")
     
@@ -599,23 +1515,36 @@ def create_timeline_map() -> str:
     logger.info(f"Timeline map created successfully with {len(processed_articles)} articles")
     return map_filename
 
-def create_timeline_html(articles: list) -> str:
-    """Generate HTML with timeline slider and map."""
-    # Group articles by date - only use dates where we actually have articles
-    articles_by_date = {}
+def timeline_data(articles: list) -> dict:
+    """Build the data the timeline page renders: article dicts plus their sorted dates."""
+    article_dicts = []
     for article in articles:
-        date = article.get('date', datetime.now().strftime('%Y-%m-%d'))
-        if date not in articles_by_date:
-            articles_by_date[date] = []
-        articles_by_date[date].append(article)
+        article_dict = article.to_dict()
+        if not article_dict['date']:
+            article_dict['date'] = datetime.now().strftime('%Y-%m-%d')
+        article_dicts.append(article_dict)
+    
+    # Use only the dates where we have actual articles
+    dates = sorted({article_dict['date'] for article_dict in article_dicts})
+    return {"articles": article_dicts, "dates": dates}
+
+def create_timeline_html(articles: list, data_url: str = None, stream_url: str = None,
+                         last_event_id: int = 0) -> str:
+    """Generate HTML with timeline slider and map.
+    
+    The article data is embedded in the page unless ``data_url`` is given,
+    in which case the page loads it from that URL (used by static exports).
+    With ``stream_url`` the page subscribes to Server-Sent Events after
+    ``last_event_id`` and adds new or moved markers as they arrive.
+    """
+    data = timeline_data(articles)
+    dates = data['dates']
     
     # Get the actual date range from our real articles
-    if not articles_by_date:
+    if not dates:
         logger.error("No articles to create timeline from")
         return create_error_map_html("No articles available for timeline")
     
-    # Use only the dates where we have actual articles
-    dates = sorted(articles_by_date.keys())
     start_date = dates[0]
     end_date = dates[-1]
     
@@ -623,8 +1552,14 @@ def create_timeline_html(articles: list) -> str:
     
     # Convert articles to JSON for JavaScript
     import json
-    articles_json = json.dumps(articles, default=str)
-    articles_by_date_json = json.dumps(articles_by_date, default=str)
+    if data_url:
+        data_loader = f"fetch({json.dumps(data_url)}).then(response => response.json()).then(initTimeline);"
+    else:
+        # Escape "</" so article text can never close the script tag early
+        data_json = json.dumps(data, default=str).replace('</', '<\\/')
+        data_loader = f"initTimeline({data_json});"
+    if stream_url:
+        data_loader += f"\n        subscribeToUpdates({json.dumps(stream_url)}, {int(last_event_id)});"
     
     html = f"""
 <!DOCTYPE html>
@@ -774,10 +1709,8 @@ def create_timeline_html(articles: list) -> str:
     <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
     
     <script>
-        // Data from Python
-        const articles = {articles_json};
-        const articlesByDate = {articles_by_date_json};
-        const dates = {json.dumps(dates)};
+        // Filled in by initTimeline()
+        let dates = [];
         
         // Initialize map
         const map = L.map('map').setView([39.8283, -98.5795], 4);
@@ -788,80 +1721,281 @@ def create_timeline_html(articles: list) -> str:
             maxZoom: 19
         }}).addTo(map);
         
-        // Store markers
-        let markers = {{}};
-        let currentMarkers = [];
+        // Points are kept sorted by date so each date is one contiguous index
+        // range; moving the slider only toggles the points that enter or leave
+        // the visible range. Markers are canvas circles created on first show,
+        // and popups are built only when clicked.
+        const renderer = L.canvas({{ padding: 0.5 }});
+        const pointLayer = L.layerGroup().addTo(map);
+        let points = [];        // {{article, marker}} sorted by date
+        let pointByUrl = {{}};
+        let dateRanges = [];    // dateRanges[i] = [start, end) into points for dates[i]
+        let visibleStart = 0;
+        let visibleEnd = 0;
+        let showingAll = false;
         let isPlaying = false;
         let playInterval = null;
+        let pendingUpdates = [];  // streamed articles waiting for the next frame
+        let updateScheduled = false;
+        const perfEnabled = new URLSearchParams(window.location.search).has('perf');
+        window.timelinePerf = {{ samples: [] }};
         
-        // Create all markers (initially hidden)
-        articles.forEach(article => {{
-            const marker = L.marker(article.coords, {{
-                icon: L.icon({{
-                    iconUrl: 'https://raw.githubusercontent.com/pointhi/leaflet-color-markers/master/img/marker-icon-orange.png',
-                    shadowUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/0.7.7/images/marker-shadow.png',
-                    iconSize: [25, 41],
-                    iconAnchor: [12, 41],
-                    popupAnchor: [1, -34],
-                    shadowSize: [41, 41]
-                }})
+        function initTimeline(data) {{
+            data.articles.sort((a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0));
+            points = data.articles.map(article => ({{ article: article, marker: null }}));
+            points.forEach(point => {{
+                pointByUrl[point.article.url] = point;
             }});
+            indexDates();
             
-            const popupContent = `
+            // Initialize with first date
+            if (dates.length > 0) {{
+                updateMap(0);
+            }}
+            if (perfEnabled) {{
+                runPerfPlayback();
+            }}
+        }}
+        
+        // Recompute each date's index range from the date-sorted points
+        function indexDates() {{
+            dates = [];
+            dateRanges = [];
+            points.forEach((point, index) => {{
+                if (dates.length === 0 || dates[dates.length - 1] !== point.article.date) {{
+                    if (dateRanges.length > 0) {{
+                        dateRanges[dateRanges.length - 1][1] = index;
+                    }}
+                    dates.push(point.article.date);
+                    dateRanges.push([index, points.length]);
+                }}
+            }});
+            document.getElementById('dateSlider').max = Math.max(dates.length - 1, 0);
+        }}
+        
+        // Binary search: first point dated after (or, with after=false, at or after) the date
+        function searchDate(date, after) {{
+            let low = 0;
+            let high = points.length;
+            while (low < high) {{
+                const mid = (low + high) >> 1;
+                const pointDate = points[mid].article.date;
+                if (pointDate < date || (after && pointDate === date)) {{
+                    low = mid + 1;
+                }} else {{
+                    high = mid;
+                }}
+            }}
+            return low;
+        }}
+        
+        function escapeHtml(text) {{
+            return String(text == null ? '' : text).replace(/[&<>"']/g, ch => ({{
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+            }}[ch]));
+        }}
+        
+        function popupContent(article) {{
+            return `
                 <div style="width: 300px; background-color: #2a2a2a; color: #ffffff; padding: 15px; border-radius: 8px;">
-                    <h4 style="margin-bottom: 10px; color: #ff6b6b;">${{article.title}}</h4>
-                    <p style="margin: 8px 0;"><strong>Date:</strong> ${{article.date}}</p>
-                    <p style="margin: 8px 0;"><strong>Location:</strong> ${{article.location_name}}</p>
-                    <a href="${{article.url}}" target="_blank" style="color: #4a90e2; text-decoration: none; font-weight: bold;">Read Full Article →</a>
+                    <h4 style="margin-bottom: 10px; color: #ff6b6b;">${{escapeHtml(article.title)}}</h4>
+                    <p style="margin: 8px 0;"><strong>Date:</strong> ${{escapeHtml(article.date)}}</p>
+                    <p style="margin: 8px 0;"><strong>Location:</strong> ${{escapeHtml(article.location_name)}}</p>
+                    <a href="${{escapeHtml(article.url)}}" target="_blank" style="color: #4a90e2; text-decoration: none; font-weight: bold;">Read Full Article →</a>
                 </div>
             `;
+        }}
+        
+        function markerFor(point) {{
+            if (!point.marker) {{
+                point.marker = L.circleMarker(point.article.coords, {{
+                    renderer: renderer,
+                    radius: 6,
+                    color: '#ff6b6b',
+                    weight: 1,
+                    fillColor: '#ff9f43',
+                    fillOpacity: 0.85
+                }});
+                // Popup HTML is generated on click, not up front
+                point.marker.bindPopup(() => popupContent(point.article));
+                point.marker.bindTooltip(() => escapeHtml(point.article.title));
+            }}
+            return point.marker;
+        }}
+        
+        function setRange(start, end, visible) {{
+            for (let i = start; i < end; i++) {{
+                if (visible) {{
+                    pointLayer.addLayer(markerFor(points[i]));
+                }} else if (points[i].marker) {{
+                    pointLayer.removeLayer(points[i].marker);
+                }}
+            }}
+        }}
+        
+        // Make exactly points[start, end) visible, touching only the difference
+        function setVisibleRange(start, end) {{
+            setRange(visibleStart, Math.min(visibleEnd, start), false);
+            setRange(Math.max(visibleStart, end), visibleEnd, false);
+            setRange(start, Math.min(end, visibleStart), true);
+            setRange(Math.max(start, visibleEnd), end, true);
+            visibleStart = start;
+            visibleEnd = Math.max(start, end);
+        }}
+        
+        // Apply the queued articles in one pass: place each by binary search,
+        // re-index dates once and toggle only the points that were added or moved
+        function applyPendingUpdates() {{
+            updateScheduled = false;
+            const slider = document.getElementById('dateSlider');
+            const selectedDate = showingAll ? null : dates[parseInt(slider.value)];
+            const changed = new Set();
             
-            marker.bindPopup(popupContent);
-            marker.bindTooltip(article.title);
+            pendingUpdates.forEach(article => {{
+                let point = pointByUrl[article.url];
+                if (point && point.article.date === article.date) {{
+                    Object.assign(point.article, article);
+                    if (point.marker) {{
+                        point.marker.setLatLng(article.coords);
+                    }}
+                    return;
+                }}
+                if (point) {{
+                    // The date changed, so take the point out of its old position
+                    let index = searchDate(point.article.date, false);
+                    while (points[index] !== point) {{
+                        index++;
+                    }}
+                    points.splice(index, 1);
+                    Object.assign(point.article, article);
+                    if (point.marker) {{
+                        point.marker.setLatLng(article.coords);
+                    }}
+                }} else {{
+                    point = {{ article: article, marker: null }};
+                    pointByUrl[article.url] = point;
+                }}
+                points.splice(searchDate(article.date, true), 0, point);
+                changed.add(point);
+            }});
+            pendingUpdates = [];
+            if (changed.size === 0) {{
+                return;
+            }}
+            indexDates();
             
-            if (!markers[article.date]) {{
-                markers[article.date] = [];
+            const dateIndex = selectedDate ? dates.indexOf(selectedDate) : -1;
+            if (!showingAll && dateIndex < 0) {{
+                // No date was shown yet (or the shown one emptied out); indices shifted, so redraw
+                pointLayer.clearLayers();
+                visibleStart = 0;
+                visibleEnd = 0;
+                updateMap(Math.min(parseInt(slider.value), dates.length - 1));
+                return;
             }}
-            markers[article.date].push(marker);
-        }});
+            
+            changed.forEach(point => {{
+                if (showingAll || point.article.date === selectedDate) {{
+                    pointLayer.addLayer(markerFor(point));
+                }} else if (point.marker) {{
+                    pointLayer.removeLayer(point.marker);
+                }}
+            }});
+            const range = showingAll ? [0, points.length] : dateRanges[dateIndex];
+            visibleStart = range[0];
+            visibleEnd = range[1];
+            if (showingAll) {{
+                showAll();
+            }} else {{
+                slider.value = dateIndex;
+                updateMap(dateIndex);
+            }}
+        }}
+        
+        // Queue a streamed article; a burst of events is applied once per frame
+        function queueArticle(article) {{
+            pendingUpdates.push(article);
+            if (!updateScheduled) {{
+                updateScheduled = true;
+                requestAnimationFrame(applyPendingUpdates);
+            }}
+        }}
+        
+        // Receive newly ingested articles without reloading the page
+        function subscribeToUpdates(streamUrl, lastEventId) {{
+            if (!window.EventSource) {{
+                return;
+            }}
+            const source = new EventSource(`${{streamUrl}}?last_id=${{lastEventId}}`);
+            source.addEventListener('article', event => queueArticle(JSON.parse(event.data)));
+            // The server can't resume from our last id (history too short, or it restarted); reload for fresh data
+            source.addEventListener('reset', () => {{
+                source.close();
+                window.location.reload();
+            }});
+        }}
+        
+        // Time an update from the call until the next frame has painted (?perf=1)
+        function measured(label, update) {{
+            if (!perfEnabled) {{
+                update();
+                return Promise.resolve();
+            }}
+            const started = performance.now();
+            update();
+            const scripted = performance.now() - started;
+            return new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(() => {{
+                window.timelinePerf.samples.push({{ label: label, script: scripted, frame: performance.now() - started }});
+                resolve();
+            }})));
+        }}
+        
+        function perfSummary() {{
+            const frames = window.timelinePerf.samples.map(sample => sample.frame).sort((a, b) => a - b);
+            const pick = fraction => frames[Math.min(frames.length - 1, Math.floor(frames.length * fraction))] || 0;
+            const mean = frames.reduce((total, frame) => total + frame, 0) / Math.max(frames.length, 1);
+            return {{ points: points.length, samples: frames.length, mean: mean, p50: pick(0.5), p95: pick(0.95), max: pick(1) }};
+        }}
+        
+        // Step through every date and then "Show All", reporting frame times
+        async function runPerfPlayback() {{
+            for (let i = 0; i < dates.length; i++) {{
+                document.getElementById('dateSlider').value = i;
+                await measured(`date ${{dates[i]}}`, () => updateMap(i));
+            }}
+            await measured('show all', showAll);
+            await measured('back to first date', () => updateMap(0));
+            const summary = perfSummary();
+            window.timelinePerf.summary = summary;
+            console.log('timeline frame times (ms)', summary);
+            document.getElementById('articleCount').textContent =
+                `${{summary.points}} pts: mean ${{summary.mean.toFixed(1)}}ms p95 ${{summary.p95.toFixed(1)}}ms`;
+        }}
         
         // Update map based on slider value
         function updateMap(dateIndex) {{
-            // Clear current markers
-            currentMarkers.forEach(marker => map.removeLayer(marker));
-            currentMarkers = [];
+            showingAll = false;
             
             if (dateIndex >= 0 && dateIndex < dates.length) {{
                 const selectedDate = dates[dateIndex];
                 document.getElementById('currentDate').textContent = selectedDate;
                 
-                // Add markers for selected date
-                if (markers[selectedDate]) {{
-                    markers[selectedDate].forEach(marker => {{
-                        map.addLayer(marker);
-                        currentMarkers.push(marker);
-                    }});
-                }}
+                // Show only the selected date's points
+                const range = dateRanges[dateIndex];
+                setVisibleRange(range[0], range[1]);
                 
-                const count = markers[selectedDate] ? markers[selectedDate].length : 0;
+                const count = range[1] - range[0];
                 document.getElementById('articleCount').textContent = `${{count}} event${{count !== 1 ? 's' : ''}}`;
             }}
         }}
         
         // Show all markers
         function showAll() {{
-            currentMarkers.forEach(marker => map.removeLayer(marker));
-            currentMarkers = [];
-            
-            Object.values(markers).forEach(dateMarkers => {{
-                dateMarkers.forEach(marker => {{
-                    map.addLayer(marker);
-                    currentMarkers.push(marker);
-                }});
-            }});
+            showingAll = true;
+            setVisibleRange(0, points.length);
             
             document.getElementById('currentDate').textContent = 'All Dates';
-            document.getElementById('articleCount').textContent = `${{currentMarkers.length}} total events`;
+            document.getElementById('articleCount').textContent = `${{points.length}} total events`;
         }}
         
         // Reset timeline
@@ -912,10 +2046,7 @@ def create_timeline_html(articles: list) -> str:
             updateMap(parseInt(e.target.value));
         }});
         
-        // Initialize with first date
-        if (dates.length > 0) {{
-            updateMap(0);
-        }}
+        {data_loader}
     </script>
 </body>
 </html>
@@ -923,33 +2054,226 @@ def create_timeline_html(articles: list) -> str:
     
     return html
 
+def export_static_site(output_dir: str) -> dict:
+    """Run the pipeline once and write a self-contained static bundle to output_dir.
+    
+    The bundle holds the HTML shell, a content-hashed JSON data file and
+    precompressed variants of each, ready to publish to an object store or
+    CDN. Returns the manifest that is also written as manifest.json.
+    """
+    import gzip
+    import hashlib
+    import json
+    
+    articles = build_timeline_articles()
+    if not articles:
+        raise RuntimeError("No real articles could be processed; nothing to export")
+    
+    data = json.dumps(timeline_data(articles), default=str, separators=(',', ':')).encode('utf-8')
+    data_filename = f"data.{hashlib.sha256(data).hexdigest()[:12]}.json"
+    html = create_timeline_html(articles, data_url=data_filename).encode('utf-8')
+    
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    
+    os.makedirs(output_dir, exist_ok=True)
+    files = {}
+    for filename, body in (("index.html", html), (data_filename, data)):
+        variants = {filename: body, f"{filename}.gz": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants[f"{filename}.br"] = brotli.compress(body)
+        for variant_name, variant_body in variants.items():
+            with open(os.path.join(output_dir, variant_name), 'wb') as f:
+                f.write(variant_body)
+            files[variant_name] = {
+                "bytes": len(variant_body),
+                "sha256": hashlib.sha256(variant_body).hexdigest()
+            }
+    
+    manifest = {
+        "generated_at": datetime.now().isoformat(),
+        "articles": len(articles),
+        "entry": "index.html",
+        "data": data_filename,
+        "files": files
+    }
+    with open(os.path.join(output_dir, "manifest.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    
+    logger.info(f"Exported static timeline with {len(articles)} articles to {output_dir} ({data_filename})")
+    return manifest
+
+# Background ingestion thread, started on first use when INGEST_INTERVAL_MINUTES is set
+_ingestion_thread = None
+_ingestion_lock = threading.Lock()
+
+def _ingestion_loop() -> None:
+    interval = CONFIG['INGEST_INTERVAL_MINUTES'] * 60
+    while True:
+        time.sleep(interval)
+        try:
+            logger.info("Background ingestion: rebuilding timeline")
+            create_timeline_map()
+        except Exception as e:
+            logger.error(f"Background ingestion failed: {e}")
+
+def ensure_background_ingestion() -> None:
+    """Start the periodic rebuild thread once, if an ingest interval is configured."""
+    global _ingestion_thread
+    if CONFIG['INGEST_INTERVAL_MINUTES'] <= 0:
+        return
+    with _ingestion_lock:
+        if _ingestion_thread is None:
+            _ingestion_thread = threading.Thread(target=_ingestion_loop, name="ingestion", daemon=True)
+            _ingestion_thread.start()
+            logger.info(f"Background ingestion every {CONFIG['INGEST_INTERVAL_MINUTES']} minutes")
+
 @app.route('/')
 def serve_map():
     """Serve the timeline map HTML file."""
+    from flask import Response
+    
+    ensure_background_ingestion()
     try:
-        map_file = create_timeline_map()
+        # Serve the latest build (or boot snapshot) at once and refresh it behind the scenes
+        warm_start()
+        html, stale = latest_timeline_html()
+        if html is not None:
+            if stale and refresh_in_background():
+                logger.info("Serving previous timeline while refreshing in the background")
+            return Response(html, mimetype='text/html')
+        
+        with _build_lock:
+            # Another request may have finished a build while this one waited
+            html, _ = latest_timeline_html()
+            if html is not None:
+                return Response(html, mimetype='text/html')
+            map_file = create_timeline_map()
         logger.info(f"Serving timeline map file: {map_file}")
-        return send_file(map_file, mimetype='text/html')
+        # map.html is written to the working directory; send_file would resolve it against the app root
+        return send_file(os.path.abspath(map_file), mimetype='text/html')
     except Exception as e:
         logger.error(f"Error serving timeline map: {e}")
         return f"<h1>Error generating timeline map</h1><p>{str(e)}</p>", 500
 
+@app.route('/api/stream')
+def api_stream():
+    """Server-Sent Events stream of newly ingested or changed geocoded articles.
+    
+    Resumes after the ``Last-Event-ID`` header or ``last_id`` query parameter.
+    Holding many idle connections needs an evented server (see README).
+    """
+    from flask import Response, request, stream_with_context
+    
+    ensure_background_ingestion()
+    try:
+        last_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_id', 0))
+    except ValueError:
+        return {"error": "last_id must be an integer"}, 400
+    
+    def events(last_id):
+        yield "retry: 5000\n\n"
+        while True:
+            batch = article_broadcaster.wait(last_id, timeout=CONFIG['SSE_KEEPALIVE_SECONDS'])
+            if batch is None:
+                yield "event: reset\ndata: {}\n\n"
+                return
+            if not batch:
+                yield ": keepalive\n\n"
+                continue
+            for event_id, payload in batch:
+                yield f"id: {event_id}\nevent: article\ndata: {payload}\n\n"
+                last_id = event_id
+    
+    return Response(
+        stream_with_context(events(last_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+def encode_news_cursor(article: Article) -> str:
+    """Return an opaque resume token pointing just past ``article``."""
+    import base64
+    import json
+    
+    token = json.dumps([article.date, article.url], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(token).decode('ascii').rstrip('=')
+
+def decode_news_cursor(cursor: str) -> tuple:
+    """Return ``(date, url)`` from a resume token, raising ValueError if it is malformed."""
+    import base64
+    import binascii
+    import json
+    
+    try:
+        token = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        date, url = json.loads(token)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from None
+    if not isinstance(date, str) or not isinstance(url, str):
+        raise ValueError("Invalid cursor: expected a date and a url string")
+    return date, url
+
+def iter_news_ndjson(news: list, cursor: str = None, limit: int = None):
+    """Yield one JSON line per article, newest first, resuming after ``cursor``.
+    
+    Each line carries a ``cursor`` field to resume from. If the cursor's
+    article is no longer in the list, the stream restarts at the cursor's
+    date, so same-day articles may repeat but none are skipped.
+    """
+    import json
+    
+    start = 0
+    if cursor:
+        cursor_date, cursor_url = decode_news_cursor(cursor)
+        start = None
+        for index, article in enumerate(news):
+            if article.url == cursor_url:
+                start = index + 1
+                break
+        if start is None:
+            start = next((index for index, article in enumerate(news) if article.date <= cursor_date), len(news))
+    
+    end = len(news) if limit is None else min(len(news), start + limit)
+    for index in range(start, end):
+        article = news[index]
+        line = article.to_dict()
+        line["cursor"] = encode_news_cursor(article)
+        yield json.dumps(line, default=str) + "\n"
+
 @app.route('/api/news')
 def api_news():
-    """API endpoint to get raw news data with optional date filtering."""
-    from flask import request
+    """API endpoint to get raw news data with optional date filtering.
+    
+    ``?format=ndjson`` streams one article per line instead of building a
+    single JSON document; pass a line's ``cursor`` back to resume after it.
+    """
+    from flask import Response, request, stream_with_context
     
     try:
         from_date = request.args.get('from_date')
         to_date = request.args.get('to_date')
         
         news = scrape_news(from_date, to_date)
-        return {"articles": news, "count": len(news), "from_date": from_date, "to_date": to_date}
+        if request.args.get('format') == 'ndjson':
+            cursor = request.args.get('cursor')
+            limit = request.args.get('limit', type=int)
+            if cursor:
+                decode_news_cursor(cursor)  # reject bad cursors before streaming starts
+            return Response(
+                stream_with_context(iter_news_ndjson(news, cursor=cursor, limit=limit)),
+                mimetype='application/x-ndjson'
+            )
+        return {"articles": [article.to_dict() for article in news], "count": len(news), "from_date": from_date, "to_date": to_date}
+    except ValueError as e:
+        return {"error": str(e)}, 400
     except Exception as e:
         logger.error(f"Error in news API: {e}")
         return {"error": str(e)}, 500
@@ -966,10 +2290,10 @@ def api_timeline():
         # Group by date
         timeline = {}
         for article in news:
-            date = article.get('date', datetime.now().strftime('%Y-%m-%d'))
+            date = article.date or datetime.now().strftime('%Y-%m-%d')
             if date not in timeline:
                 timeline[date] = []
-            timeline[date].append(article)
+            timeline[date].append(article.to_dict())
         
         return {
             "timeline": timeline,
@@ -981,11 +2305,71 @@ def api_timeline():
         logger.error(f"Error in timeline API: {e}")
         return {"error": str(e)}, 500
 
+@app.route('/api/metrics')
+def api_metrics():
+    """API endpoint for runtime counters such as article fetch skips and breaker state."""
+    try:
+        with _metrics_lock:
+            window_planner = dict(metrics["window_planner"])
+        return {
+            "window_planner": window_planner,
+            "article_fetch": article_fetch_report(),
+            "geocoder": geocoder_breaker.state()
+        }
+    except Exception as e:
+        logger.error(f"Error in metrics API: {e}")
+        return {"error": str(e)}, 500
+
+@app.route('/api/stats')
+def api_stats():
+    """API endpoint for aggregate article counts by date, location or source."""
+    from flask import request
+
+    try:
+        group_by = request.args.get('group_by', 'date')
+        from_date = request.args.get('from_date')
+        to_date = request.args.get('to_date')
+        counts = timeline_stats.query(
+            group_by=group_by,
+            from_date=from_date,
+            to_date=to_date,
+            location=request.args.get('location'),
+            source=request.args.get('source')
+        )
+        return {
+            "group_by": group_by,
+            "counts": counts,
+            "total": sum(counts.values()),
+            "date_range": {"from": from_date, "to": to_date}
+        }
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    except Exception as e:
+        logger.error(f"Error in stats API: {e}")
+        return {"error": str(e)}, 500
+
 if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="ICE GIS Timeline App")
+    subparsers = parser.add_subparsers(dest='command')
+    build_parser = subparsers.add_parser('build', help="export the timeline as a static site bundle")
+    build_parser.add_argument('--output', default='dist', help="directory to write the bundle to (default: dist)")
+    args = parser.parse_args()
+    
+    if args.command == 'build':
+        try:
+            export_static_site(args.output)
+        except RuntimeError as e:
+            logger.error(str(e))
+            sys.exit(1)
+        sys.exit(0)
+    
     port = int(os.getenv('PORT', 8080))
     debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     
     logger.info(f"Starting ICE GIS App on port {port}")
+    warm_start()
     logger.info(f"Debug mode: {debug}")
     
     app.run(
@@ -0,0 +1,86 @@
+"""Compare peak memory of dict articles vs. compact Article records.
+
+Builds a synthetic corpus shaped like NewsAPI results, runs it through the
+same steps the map build does (scrape -> extract -> attach location), and
+reports peak RSS for each representation in a separate child process. As in
+the app, the scraped originals stay alive next to the processed articles,
+because the scrape cache keeps them (with content) for the API.
+
+Usage:
+    python benchmarks/article_memory.py [--articles 50000]
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SOURCES = ["Associated Press", "Reuters", "CNN", "Fox News", "NPR", "The Hill", "Politico"]
+LOCATIONS = ["houston", "los angeles", "chicago", "new york", "phoenix", "miami", "denver"]
+
+
+def raw_article(i: int) -> dict:
+    """Return one synthetic NewsAPI-shaped article."""
+    return {
+        "title": f"ICE arrests reported in {LOCATIONS[i % len(LOCATIONS)].title()} operation #{i}",
+        "url": f"https://news.example.com/2025/story-{i}",
+        "published_at": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}T12:00:00Z",
+        "date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        "description": ("Federal immigration agents carried out an enforcement operation. " * 5)[:300] + "...",
+        "source": "".join(SOURCES[i % len(SOURCES)]),  # fresh string, as json.loads produces
+        "content": "Immigration enforcement officers detained several people on Tuesday " * 3,
+    }
+
+
+def run_dicts(count: int) -> tuple:
+    articles = [raw_article(i) for i in range(count)]
+    processed = []
+    for i, item in enumerate(articles):
+        location_name = "".join(LOCATIONS[i % len(LOCATIONS)])
+        processed.append({**item, 'location_name': location_name, 'coords': [29.76, -95.37], 'id': f'marker_{i}'})
+    return articles, processed
+
+
+def run_records(count: int) -> tuple:
+    from app import Article
+    articles = [Article(**raw_article(i)) for i in range(count)]
+    processed = []
+    for i, item in enumerate(articles):
+        location_name = "".join(LOCATIONS[i % len(LOCATIONS)])
+        processed.append(item.located(location_name, [29.76, -95.37], f'marker_{i}'))
+    return articles, processed
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=50000)
+    parser.add_argument('--mode', choices=['dicts', 'records'])
+    args = parser.parse_args()
+
+    if args.mode:
+        import app  # noqa: F401 -- load the app in both modes so baselines match
+        baseline = peak_rss_mb()
+        {'dicts': run_dicts, 'records': run_records}[args.mode](args.articles)
+        print(f"{baseline:.1f} {peak_rss_mb():.1f}")
+        return
+
+    for mode in ('dicts', 'records'):
+        output = subprocess.run(
+            [sys.executable, __file__, '--mode', mode, '--articles', str(args.articles)],
+            check=True, capture_output=True, text=True
+        ).stdout.split()
+        baseline, peak = float(output[0]), float(output[1])
+        print(f"{mode:>8}: peak RSS {peak:.1f} MB ({peak - baseline:.1f} MB above import baseline) "
+              f"for {args.articles} articles")
+
+
+if __name__ == '__main__':
+    main()
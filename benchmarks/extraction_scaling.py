@@ -0,0 +1,68 @@
+"""Measure location extraction throughput serially and across a process pool.
+
+Builds a synthetic corpus of article texts, scores it with
+``app.extract_locations`` at several worker counts, and checks that every
+parallel run returns exactly the serial results in input order.
+
+Usage:
+    python benchmarks/extraction_scaling.py [--articles 10000] [--workers 1 2 4 8]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+PLACES = list(app.location_map.values()) + ["Springfield, IL", "Fresno, CA", "Omaha, NE"]
+FILLER = ("Federal agents said the operation was part of a broader effort. Advocates questioned "
+          "the tactics used and local officials asked for more information about detentions. ")
+
+
+def synthetic_corpus(count: int, seed: int = 7) -> list:
+    """Return ``(title, all_text)`` pairs resembling fetched article text."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        place = rng.choice(PLACES)
+        city = place.split(",")[0]
+        title = rng.choice([
+            f"ICE raids in {city} leave families searching for answers",
+            f"Immigration enforcement surge reported across {city}",
+            f"Officials respond to detention concerns #{i}",
+        ])
+        body = f"{title} {FILLER * rng.randint(2, 8)} Reporting from {place}. {FILLER}"
+        corpus.append((title, body.lower()))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=10000)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    app.logger.setLevel(logging.ERROR)
+    app.CONFIG['PARALLEL_EXTRACTION_MIN_BATCH'] = 1
+    corpus = synthetic_corpus(args.articles)
+
+    serial_results = None
+    serial_time = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = app.extract_locations(corpus, workers=workers)
+        elapsed = time.perf_counter() - start
+        if serial_results is None:
+            serial_results, serial_time = results, elapsed
+        status = "ok" if results == serial_results else "MISMATCH"
+        print(f"workers {workers:>2}: {elapsed:.2f}s ({len(corpus) / elapsed:,.0f} articles/s, "
+              f"speedup {serial_time / elapsed:.2f}x) results {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Generate a timeline page with synthetic points for measuring frame times.
+
+Writes a page built by ``app.create_timeline_html`` with N synthetic
+geocoded articles. Opening it with ``?perf=1`` steps through every date
+and "Show All", then shows mean/p95 frame times in the event counter and
+logs the full summary to the console (``window.timelinePerf``).
+
+Usage:
+    python benchmarks/frontend_frames.py [--points 10000] [--dates 120] [--output bench_map.html]
+    # then open bench_map.html?perf=1 in a browser
+"""
+import argparse
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def synthetic_articles(count: int, date_count: int, seed: int = 11) -> list:
+    """Return geocoded Article records spread over the continental US and date_count days."""
+    rng = random.Random(seed)
+    first_day = date(2025, 1, 20)
+    locations = list(app.location_map)
+    articles = []
+    for i in range(count):
+        day = (first_day + timedelta(days=rng.randrange(date_count))).isoformat()
+        article = app.Article(
+            title=f"Synthetic enforcement report #{i}",
+            url=f"https://news.example.com/synthetic/{i}",
+            published_at=f"{day}T12:00:00Z",
+            date=day,
+            description="Synthetic article for front-end benchmarking.",
+            source="Benchmark"
+        )
+        coords = [rng.uniform(25.0, 49.0), rng.uniform(-124.0, -67.0)]
+        article.set_location(rng.choice(locations), coords, f"marker_{i}")
+        articles.append(article)
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--points', type=int, default=10000)
+    parser.add_argument('--dates', type=int, default=120)
+    parser.add_argument('--output', default='bench_map.html')
+    args = parser.parse_args()
+
+    html = app.create_timeline_html(synthetic_articles(args.points, args.dates))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(html)
+    print(f"Wrote {args.output} with {args.points} points over {args.dates} dates "
+          f"({len(html) / 1024:.0f} KB). Open it with ?perf=1 to measure frame times.")
+
+
+if __name__ == '__main__':
+    main()
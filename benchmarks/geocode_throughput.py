@@ -0,0 +1,55 @@
+"""Measure geocoding throughput against the local geocoder stand-in.
+
+Starts ``standins.GeocoderStandIn``, points the app's geocoder at it and
+resolves a batch of unique location names at several concurrency levels.
+
+Usage:
+    python benchmarks/geocode_throughput.py [--names 200] [--latency 0.02] [--backend nominatim]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+from standins import GeocoderStandIn  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--names', type=int, default=200, help="unique location names per run")
+    parser.add_argument('--latency', type=float, default=0.02, help="stand-in latency per request in seconds")
+    parser.add_argument('--backend', choices=['nominatim', 'photon'], default='nominatim')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    args = parser.parse_args()
+
+    with GeocoderStandIn(latency=args.latency) as server:
+        app.CONFIG.update({
+            'GEOCODER_BACKEND': args.backend,
+            'GEOCODER_URL': server.url,
+            'RATE_LIMIT_DELAY': 0,
+        })
+        names = [f"benchmark town {i}" for i in range(args.names)]
+
+        for concurrency in args.concurrency:
+            app.CONFIG['GEOCODE_CONCURRENCY'] = concurrency
+            app.reset_geocoder()
+            for name in names:
+                app.cache.pop(f"geocode_{name}", None)
+
+            start = time.perf_counter()
+            results = app.geocode_locations(names)
+            elapsed = time.perf_counter() - start
+            fallbacks = sum(1 for coords in results.values() if coords == [39.8283, -98.5795])
+            print(f"concurrency {concurrency:>3}: {len(names)} lookups in {elapsed:.2f}s "
+                  f"({len(names) / elapsed:.1f}/s, {fallbacks} fallbacks)")
+
+        start = time.perf_counter()
+        app.geocode_locations(names)
+        print(f"warm cache: {len(names)} lookups in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Fail when importing the app exceeds its cold-start budget.
+
+Runs ``python -X importtime -c "import app"`` in fresh interpreters, takes
+the best cumulative time for ``app`` and compares it with the budget. Also
+fails if a dependency that must load lazily is imported at startup.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 400] [--runs 3] [--top 10]
+
+The budget can also be set with IMPORT_TIME_BUDGET_MS. Exit status is 1 on
+a regression, so the script can gate CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed on request paths, never at import time
+LAZY_MODULES = ("requests", "geopy", "bs4", "folium")
+
+
+def measure() -> dict:
+    """Return ``{module: (self_us, cumulative_us, depth)}`` for one cold import of the app.
+
+    Entries keep ``-X importtime`` order, where a module is listed after
+    everything it imports and its depth is the nesting level (0 = top level).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing app failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        # The name follows one space plus two spaces per nesting level
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        timings[module.strip()] = (int(self_us), int(cumulative_us), depth)
+    return timings
+
+
+def direct_imports(timings: dict, parent: str) -> list:
+    """Return ``(module, cumulative_us)`` for the modules ``parent`` imported itself."""
+    entries = list(timings.items())
+    index = next(i for i, (module, _) in enumerate(entries) if module == parent)
+    depth = entries[index][1][2]
+    children = []
+    # Children are listed just before their parent; stop at the previous sibling
+    for module, (_, cumulative, module_depth) in reversed(entries[:index]):
+        if module_depth <= depth:
+            break
+        if module_depth == depth + 1:
+            children.append((module, cumulative))
+    return children
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv('IMPORT_TIME_BUDGET_MS', 400)))
+    parser.add_argument('--runs', type=int, default=3, help="best of N cold imports")
+    parser.add_argument('--top', type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    best = min(runs, key=lambda timings: timings["app"][1])
+    total_ms = best["app"][1] / 1000
+
+    print(f"import app: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms, best of {args.runs})")
+    print("slowest direct imports of app (cumulative):")
+    for module, cumulative in sorted(direct_imports(best, "app"), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+    failures = []
+    eager = sorted({module.split(".")[0] for module in best} & set(LAZY_MODULES))
+    if eager:
+        failures.append(f"imported at startup but should load lazily: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"import took {total_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+"""End-to-end HTTP load test against local upstream stand-ins.
+
+Boots the NewsAPI, geocoder and article page stand-ins, starts the app in
+a subprocess pointed at them, and drives ``/``, ``/api/news`` and
+``/api/timeline`` at each concurrency level in two scenarios:
+
+  cold  a fresh app process with no snapshot, so the first requests pay
+        for the full fetch/extract/geocode pipeline
+  warm  the same process after every endpoint has been primed
+
+Per endpoint it reports p50/p95/p99 latency, throughput, error rate and
+the app's peak RSS, and writes everything to a JSON report that can be
+compared across releases.
+
+Usage:
+    python benchmarks/loadtest.py [--concurrency 50 500] [--requests 1000]
+        [--newsapi-latency-ms 80] [--geocoder-latency-ms 20] [--article-latency-ms 150]
+        [--newsapi-error-rate 0] [--geocoder-error-rate 0] [--article-error-rate 0.05]
+        [--server flask|gunicorn] [--output loadtest_report.json]
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from standins import ArticlePageStandIn, GeocoderStandIn, NewsAPIStandIn  # noqa: E402
+
+ENDPOINTS = ["/", "/api/news", "/api/timeline"]
+
+
+def free_port() -> int:
+    import socket
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def process_rss_kb(pid: int) -> int:
+    """Return resident memory of a process and its direct children in KB (Linux only, else 0)."""
+    total = 0
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            pids += [int(child) for child in f.read().split()]
+    except OSError:
+        pass
+    for current in pids:
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+        except OSError:
+            continue
+    return total
+
+
+class RSSSampler:
+    """Track the peak RSS of the app process while a load run is active."""
+
+    def __init__(self, pid: int, interval: float = 0.05):
+        self.pid = pid
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_kb = max(self.peak_kb, process_rss_kb(self.pid))
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_kb = max(self.peak_kb, process_rss_kb(self.pid))
+
+
+class AppProcess:
+    """Run the app in a subprocess with its upstreams pointed at the stand-ins."""
+
+    def __init__(self, server: str, env: dict, workdir: str):
+        self.port = free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.server = server
+        self.env = {**os.environ, **env, "PORT": str(self.port), "PYTHONPATH": REPO_ROOT}
+        self.workdir = workdir
+        self.process = None
+
+    def __enter__(self):
+        if self.server == "gunicorn":
+            command = [sys.executable, "-m", "gunicorn", "--worker-class", "gevent", "--workers", "1",
+                       "--worker-connections", "10000", "--bind", f"127.0.0.1:{self.port}", "app:app"]
+        else:
+            command = [sys.executable, os.path.join(REPO_ROOT, "app.py")]
+        self.log = open(os.path.join(self.workdir, "app-stdout.log"), "ab")
+        self.process = subprocess.Popen(command, cwd=self.workdir, env=self.env,
+                                        stdout=self.log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"App exited with status {self.process.returncode}; "
+                                   f"see {self.workdir}/app-stdout.log")
+            try:
+                with urllib.request.urlopen(f"{self.url}/health", timeout=2):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError("App did not become healthy within 60s")
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self.log.close()
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def run_load(url: str, concurrency: int, total_requests: int, timeout: float) -> dict:
+    """Issue total_requests GETs from concurrency threads and summarize the results."""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    remaining = [total_requests]
+
+    def worker():
+        nonlocal errors
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            started = time.perf_counter()
+            ok = False
+            try:
+                with urllib.request.urlopen(url, timeout=timeout) as response:
+                    response.read()
+                    ok = 200 <= response.status < 300
+            except (urllib.error.URLError, http.client.HTTPException, OSError):
+                # HTTPException covers IncompleteRead, BadStatusLine and friends under load
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                if not ok:
+                    errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(worker) for _ in range(concurrency)]
+    for future in futures:
+        future.result()  # surface harness bugs instead of silently losing a worker
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    completed = len(latencies)
+    return {
+        "requests": completed,
+        "errors": errors,
+        "error_rate": round(errors / completed, 4) if completed else None,
+        "throughput_rps": round(completed / wall, 2) if wall else None,
+        "wall_seconds": round(wall, 3),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2),
+            "mean": round(sum(latencies) / completed * 1000, 2),
+        } if completed else None,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 500])
+    parser.add_argument("--requests", type=int, default=1000, help="requests per endpoint per concurrency level")
+    parser.add_argument("--timeout", type=float, default=120.0, help="client timeout per request in seconds")
+    parser.add_argument("--server", choices=["flask", "gunicorn"], default="flask")
+    parser.add_argument("--scenarios", nargs="+", choices=["cold", "warm"], default=["cold", "warm"])
+    parser.add_argument("--newsapi-latency-ms", type=float, default=80)
+    parser.add_argument("--geocoder-latency-ms", type=float, default=20)
+    parser.add_argument("--article-latency-ms", type=float, default=150)
+    parser.add_argument("--newsapi-error-rate", type=float, default=0.0)
+    parser.add_argument("--geocoder-error-rate", type=float, default=0.0)
+    parser.add_argument("--article-error-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="loadtest_report.json")
+    args = parser.parse_args()
+
+    articles = ArticlePageStandIn(latency=args.article_latency_ms / 1000,
+                                  error_rate=args.article_error_rate, seed=args.seed).start()
+    newsapi = NewsAPIStandIn(latency=args.newsapi_latency_ms / 1000, error_rate=args.newsapi_error_rate,
+                             seed=args.seed, article_base=articles.url).start()
+    geocoder = GeocoderStandIn(latency=args.geocoder_latency_ms / 1000,
+                               error_rate=args.geocoder_error_rate, seed=args.seed).start()
+    app_env = {
+        "NEWS_API_KEY": "loadtest",
+        "NEWS_API_URL": f"{newsapi.url}/v2/everything",
+        "GEOCODER_URL": geocoder.url,
+        "RATE_LIMIT_DELAY": "0",
+        "FLASK_DEBUG": "false",
+    }
+
+    results = []
+    try:
+        for scenario in args.scenarios:
+            for concurrency in args.concurrency:
+                for endpoint in ENDPOINTS:
+                    # Each cold run gets a fresh process and working directory, so no
+                    # in-memory cache, snapshot or map.html survives from earlier runs
+                    with tempfile.TemporaryDirectory(prefix="ice-loadtest-") as workdir:
+                        env = {**app_env, "SNAPSHOT_PATH": os.path.join(workdir, "articles.snapshot")}
+                        with AppProcess(args.server, env, workdir) as app_process:
+                            if scenario == "warm":
+                                for prime in ENDPOINTS:
+                                    with urllib.request.urlopen(f"{app_process.url}{prime}", timeout=args.timeout) as r:
+                                        r.read()
+                            upstream_before = (newsapi.requests, geocoder.requests, articles.requests)
+                            with RSSSampler(app_process.process.pid) as sampler:
+                                summary = run_load(f"{app_process.url}{endpoint}", concurrency,
+                                                   args.requests, args.timeout)
+                            upstream_after = (newsapi.requests, geocoder.requests, articles.requests)
+
+                    summary.update({
+                        "scenario": scenario,
+                        "endpoint": endpoint,
+                        "concurrency": concurrency,
+                        "peak_rss_mb": round(sampler.peak_kb / 1024, 1) if sampler.peak_kb else None,
+                        "upstream_requests": dict(zip(
+                            ("newsapi", "geocoder", "articles"),
+                            (after - before for before, after in zip(upstream_before, upstream_after))
+                        )),
+                    })
+                    results.append(summary)
+                    latency = summary["latency_ms"] or {}
+                    print(f"{scenario:>4} c={concurrency:<4} {endpoint:<14} "
+                          f"p50 {latency.get('p50')}ms p95 {latency.get('p95')}ms p99 {latency.get('p99')}ms "
+                          f"{summary['throughput_rps']} req/s errors {summary['error_rate']} "
+                          f"peak RSS {summary['peak_rss_mb']} MB", flush=True)
+    finally:
+        for server in (newsapi, geocoder, articles):
+            server.stop()
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "server": args.server,
+        "requests_per_run": args.requests,
+        "upstreams": {
+            "newsapi": {"latency_ms": args.newsapi_latency_ms, "error_rate": args.newsapi_error_rate},
+            "geocoder": {"latency_ms": args.geocoder_latency_ms, "error_rate": args.geocoder_error_rate},
+            "articles": {"latency_ms": args.article_latency_ms, "error_rate": args.article_error_rate},
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
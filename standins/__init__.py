@@ -0,0 +1,11 @@
+"""Local stand-in servers for the app's upstream services.
+
+These let tests, benchmarks and load tests run the full pipeline without
+touching NewsAPI, Nominatim or publisher sites.
+"""
+from standins.server import StandInServer
+from standins.geocoder import GeocoderStandIn
+from standins.newsapi import NewsAPIStandIn
+from standins.articles import ArticlePageStandIn
+
+__all__ = ["StandInServer", "GeocoderStandIn", "NewsAPIStandIn", "ArticlePageStandIn"]
@@ -0,0 +1,48 @@
+"""Stand-in for publisher article pages.
+
+Serves ``/article/<id>`` as a small HTML page whose body names a
+"City, ST" location, so the app's page fetch and location extraction run
+end to end without contacting real publishers.
+
+Usage:
+    python -m standins.articles --port 8090 [--latency 0.05] [--error-rate 0.1]
+"""
+import argparse
+import html
+
+from standins.newsapi import CITIES
+from standins.server import StandInServer
+
+FILLER = ("Advocates gathered outside the federal building on Tuesday. Officials declined to say how many "
+          "people remained in detention, and attorneys said families had not been notified. ")
+
+
+class ArticlePageStandIn(StandInServer):
+    """Answer article page requests with deterministic HTML."""
+
+    def handle(self, path: str, params: dict):
+        parts = path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "article" or not parts[1].isdigit():
+            return 404, "text/html", "<html><body>Not found</body></html>"
+
+        article_id = int(parts[1])
+        city, state = CITIES[article_id % len(CITIES)]
+        body = (f"<p>{html.escape(city)}, {state} - Immigration and Customs Enforcement agents arrested "
+                f"several people in an operation this week.</p>" + f"<p>{FILLER}</p>" * 6)
+        page = (f"<html><head><title>Article {article_id}</title><script>var tracking = 1;</script>"
+                f"<style>p {{ margin: 0 }}</style></head><body><article>{body}</article></body></html>")
+        return 200, "text/html; charset=utf-8", page
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the article page stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    args = parser.parse_args()
+    ArticlePageStandIn(args.host, args.port, args.latency, args.error_rate).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Stand-in for a self-hosted Nominatim or Photon geocoder.
+
+Serves Nominatim's ``/search`` and Photon's ``/api`` endpoints with
+deterministic coordinates inside the continental US, so the app can be
+pointed at it with ``GEOCODER_URL``.
+
+Usage:
+    python -m standins.geocoder --port 8088 [--latency 0.01] [--error-rate 0.0]
+"""
+import argparse
+import zlib
+
+from standins.server import StandInServer, json_response
+
+# Queries containing this marker return no results, for exercising fallbacks
+NOT_FOUND_MARKER = "nowhere"
+
+
+def coordinates_for(query: str) -> tuple:
+    """Map a query to stable coordinates within the continental US."""
+    digest = zlib.crc32(query.lower().encode("utf-8"))
+    latitude = 25.0 + (digest % 2400) / 100.0            # 25.00 .. 48.99
+    longitude = -124.0 + ((digest >> 12) % 5700) / 100.0  # -124.00 .. -67.01
+    return round(latitude, 4), round(longitude, 4)
+
+
+class GeocoderStandIn(StandInServer):
+    """Answer Nominatim and Photon search requests."""
+
+    def handle(self, path: str, params: dict):
+        query = params.get("q", "")
+        found = bool(query) and NOT_FOUND_MARKER not in query.lower()
+
+        if path.rstrip("/") == "/search":
+            if not found:
+                return json_response([])
+            latitude, longitude = coordinates_for(query)
+            return json_response([{
+                "place_id": zlib.crc32(query.encode("utf-8")),
+                "lat": str(latitude),
+                "lon": str(longitude),
+                "display_name": query,
+                "boundingbox": [str(latitude - 0.1), str(latitude + 0.1),
+                                str(longitude - 0.1), str(longitude + 0.1)],
+            }])
+
+        if path.rstrip("/") == "/api":
+            features = []
+            if found:
+                latitude, longitude = coordinates_for(query)
+                features.append({
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+                    "properties": {"name": query, "country": "United States"},
+                })
+            return json_response({"type": "FeatureCollection", "features": features})
+
+        return json_response({"error": f"unknown path {path}"}, status=404)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the geocoder stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    args = parser.parse_args()
+    GeocoderStandIn(args.host, args.port, args.latency, args.error_rate).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
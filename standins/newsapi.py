@@ -0,0 +1,88 @@
+"""Stand-in for the NewsAPI ``/v2/everything`` endpoint.
+
+Serves a deterministic corpus of immigration-enforcement articles for each
+query, dated within the last few weeks and linking to an article page
+server (see ``standins.articles``). Honours ``from``, ``to`` and
+``pageSize`` and reports ``totalResults`` like the real API, so the app can
+be pointed at it with ``NEWS_API_URL=<url>/v2/everything``.
+
+Usage:
+    python -m standins.newsapi --port 8089 --article-base http://127.0.0.1:8090
+"""
+import argparse
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from standins.server import StandInServer, json_response
+
+CITIES = [
+    ("Houston", "TX"), ("Dallas", "TX"), ("Chicago", "IL"), ("Los Angeles", "CA"), ("Phoenix", "AZ"),
+    ("Miami", "FL"), ("Denver", "CO"), ("Atlanta", "GA"), ("Seattle", "WA"), ("Newark", "NJ"),
+]
+SOURCES = ["Associated Press", "Reuters", "NPR", "The Hill", "Local Wire"]
+
+
+class NewsAPIStandIn(StandInServer):
+    """Answer ``/v2/everything`` searches from a synthetic article corpus."""
+
+    def __init__(self, *args, article_base: str = "http://127.0.0.1:8090", articles_per_query: int = 40,
+                 days: int = 25, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.article_base = article_base.rstrip("/")
+        self.articles_per_query = articles_per_query
+        self.days = days
+
+    def corpus(self, query: str) -> list:
+        """Return the articles for a query, newest first; queries share some URLs."""
+        today = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+        seed = zlib.crc32(query.encode("utf-8"))
+        articles = []
+        for i in range(self.articles_per_query):
+            # Every fourth article is shared across queries to exercise de-duplication
+            article_id = i if i % 4 == 0 else (seed % 100000) * 1000 + i
+            city, state = CITIES[article_id % len(CITIES)]
+            published = today - timedelta(days=article_id % self.days, hours=article_id % 11)
+            short = article_id % 3 == 0  # short text makes the app fetch the article page
+            articles.append({
+                "source": {"id": None, "name": SOURCES[article_id % len(SOURCES)]},
+                "author": "Stand-in Reporter",
+                "title": f"ICE arrests reported in {city} as immigration enforcement expands #{article_id}",
+                "description": "Agents detained people." if short else
+                               f"Federal immigration agents carried out an enforcement operation in "
+                               f"{city}, {state}, according to local officials and advocates.",
+                "url": f"{self.article_base}/article/{article_id}",
+                "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "content": None if short else f"Immigration officers in {city}, {state} said the raids continued.",
+            })
+        return articles
+
+    def handle(self, path: str, params: dict):
+        if path.rstrip("/") != "/v2/everything":
+            return json_response({"status": "error", "code": "notFound", "message": path}, status=404)
+        if not params.get("apiKey"):
+            return json_response({"status": "error", "code": "apiKeyMissing", "message": "No API key"}, status=401)
+
+        articles = self.corpus(params.get("q", ""))
+        if params.get("from"):
+            articles = [a for a in articles if a["publishedAt"][:10] >= params["from"][:10]]
+        if params.get("to"):
+            articles = [a for a in articles if a["publishedAt"][:10] <= params["to"][:10]]
+        articles.sort(key=lambda a: a["publishedAt"], reverse=True)
+        page_size = min(int(params.get("pageSize", 100)), 100)
+        return json_response({"status": "ok", "totalResults": len(articles), "articles": articles[:page_size]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the NewsAPI stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--article-base", default="http://127.0.0.1:8090", help="base URL of the article page server")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    args = parser.parse_args()
+    NewsAPIStandIn(args.host, args.port, args.latency, args.error_rate,
+                   article_base=args.article_base).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
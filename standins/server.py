@@ -0,0 +1,98 @@
+"""Shared threaded HTTP server with injectable latency and errors."""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StandInServer:
+    """Run a small HTTP service in a background thread.
+
+    Subclasses implement ``handle(path, params)`` and return
+    ``(status, content_type, body)``. Every request first sleeps for
+    ``latency`` seconds and fails with a 503 at ``error_rate``.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 error_rate: float = 0.0, seed: int = None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, path: str, params: dict):
+        raise NotImplementedError
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        print(f"{type(self).__name__} listening on {self.url}")
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._should_fail():
+                    status, content_type, body = 503, "application/json", json.dumps({"error": "stand-in failure"})
+                else:
+                    parsed = urlparse(self.path)
+                    params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+                    status, content_type, body = server.handle(parsed.path, params)
+                payload = body.encode("utf-8") if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass  # keep benchmark output clean
+
+        return Handler
+
+
+def json_response(data, status: int = 200):
+    """Return a handler result carrying a JSON body."""
+    return status, "application/json", json.dumps(data)